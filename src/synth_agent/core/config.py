@@ -32,6 +32,7 @@ class LLMConfig(BaseSettings):
     timeout: int = Field(default=30, ge=1, le=300)
     max_retries: int = Field(default=4, ge=0, le=10)
     retry_delays: List[int] = Field(default=[2, 4, 8, 16])
+    max_retry_delay: int = Field(default=60, ge=1, le=3600)
     enable_cache: bool = Field(default=True)
     cache_ttl: int = Field(default=3600)
 
@@ -2,6 +2,8 @@
 Custom exceptions for the Synthetic Data Generator.
 """
 
+from typing import Optional
+
 
 class SynthAgentError(Exception):
     """Base exception for all Synthetic Agent errors."""
@@ -24,7 +26,16 @@ class LLMError(SynthAgentError):
 class LLMProviderError(LLMError):
     """Raised when an LLM provider fails."""
 
-    pass
+    def __init__(self, message: str = "", retry_after: Optional[float] = None) -> None:
+        """
+        Initialize provider error.
+
+        Args:
+            message: Error message
+            retry_after: Seconds the provider asked us to wait (Retry-After), if any
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class LLMTimeoutError(LLMError):
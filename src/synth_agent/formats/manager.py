@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 import pandas as pd
+import pyarrow as pa
 
 from synth_agent.core.config import Config
 from synth_agent.core.exceptions import FormatError
@@ -130,6 +131,37 @@ class FormatManager:
         # Export
         formatter.export(df, output_path)
 
+    def export_arrow(self, table: pa.Table, output_path: Path, format_name: str) -> None:
+        """
+        Export an Arrow table, skipping pandas where the format allows it.
+
+        Parquet tables are written directly; other formats fall back to
+        ``export`` on ``table.to_pandas()``.
+
+        Args:
+            table: Arrow table to export
+            output_path: Output file path
+            format_name: Format name (parquet, csv, etc.)
+
+        Raises:
+            FormatError: If format is unsupported or export fails
+        """
+        format_name = format_name.lower()
+        formatter = self._formatters.get(format_name)
+
+        if not isinstance(formatter, ParquetFormatter):
+            self.export(table.to_pandas(), output_path, format_name)
+            return
+
+        if table.num_rows == 0:
+            raise FormatError(f"Arrow table is empty, nothing to export as: {format_name}")
+
+        if not output_path.suffix:
+            output_path = output_path.with_suffix(formatter.get_extension())
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        formatter.export_arrow(table, output_path)
+
     def get_supported_formats(self) -> List[str]:
         """
         Get list of supported formats.
@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import Any, Dict
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from synth_agent.core.exceptions import FormatError
 from synth_agent.formats.base import BaseFormatter
@@ -42,6 +44,20 @@ class ParquetFormatter(BaseFormatter):
         except Exception as e:
             raise FormatError(f"Failed to export Parquet: {e}")
 
+    def export_arrow(self, table: pa.Table, output_path: Path) -> None:
+        """
+        Export an Arrow table to Parquet without going through pandas.
+
+        Args:
+            table: Arrow table to export
+            output_path: Output file path
+        """
+        try:
+            compression = None if self.compression == "none" else self.compression
+            pq.write_table(table, output_path, compression=compression)
+        except Exception as e:
+            raise FormatError(f"Failed to export Parquet: {e}")
+
     def get_extension(self) -> str:
         """Get file extension."""
         return ".parquet"
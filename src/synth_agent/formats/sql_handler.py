@@ -1,8 +1,9 @@
 """SQL format handler for generating INSERT statements."""
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
+import numpy as np
 import pandas as pd
 
 from synth_agent.core.exceptions import FormatError
@@ -123,50 +124,90 @@ class SQLFormatter(BaseFormatter):
         # Process in batches
         for i in range(0, len(df), self.batch_size):
             batch = df.iloc[i : i + self.batch_size]
+            rows = self._format_rows(batch)
 
             if self.dialect in ["mysql", "postgresql"]:
                 # Multi-row INSERT for MySQL/PostgreSQL
                 file.write(f"INSERT INTO {self.table_name} ({columns}) VALUES\n")
-
-                values_list = []
-                for _, row in batch.iterrows():
-                    values = self._format_values(row)
-                    values_list.append(f"    ({values})")
-
-                file.write(",\n".join(values_list))
+                file.write(",\n".join(f"    ({values})" for values in rows))
                 file.write(";\n\n")
             else:
                 # Single-row INSERTs for standard SQL/SQLite
-                for _, row in batch.iterrows():
-                    values = self._format_values(row)
+                for values in rows:
                     file.write(f"INSERT INTO {self.table_name} ({columns}) VALUES ({values});\n")
 
                 file.write("\n")
 
-    def _format_values(self, row: pd.Series) -> str:
+    def _format_rows(self, df: pd.DataFrame) -> List[str]:
         """
-        Format row values for SQL INSERT.
+        Format DataFrame rows as SQL value lists.
+
+        Values are formatted column by column so quoting and escaping run as
+        NumPy string operations instead of per-cell Python calls.
 
         Args:
-            row: DataFrame row
+            df: DataFrame (or batch) to format
 
         Returns:
-            Formatted values string
-        """
-        formatted = []
-        for value in row:
-            if pd.isna(value):
-                formatted.append("NULL")
-            elif isinstance(value, (int, float)):
-                formatted.append(str(value))
-            elif isinstance(value, bool):
-                formatted.append("TRUE" if value else "FALSE")
-            else:
-                # Escape single quotes in strings
-                str_value = str(value).replace("'", "''")
-                formatted.append(f"'{str_value}'")
+            One comma-separated values string per row
+        """
+        if df.empty:
+            return [""] * len(df)
+
+        formatted = [self._format_column(df[col]) for col in df.columns]
+
+        rows = formatted[0]
+        for column in formatted[1:]:
+            rows = np.char.add(np.char.add(rows, ", "), column)
+
+        return rows.tolist()
+
+    def _format_column(self, series: pd.Series) -> np.ndarray:
+        """
+        Format a column's values for SQL INSERT.
+
+        Args:
+            series: DataFrame column
 
-        return ", ".join(formatted)
+        Returns:
+            Array of SQL literals (NULL for missing values)
+        """
+        null_mask = series.isna().to_numpy()
+
+        if pd.api.types.is_bool_dtype(series.dtype):
+            literals = np.where(series.to_numpy(dtype=bool, na_value=False), "TRUE", "FALSE")
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            literals = series.to_numpy(dtype=object).astype(str)
+        elif series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) != "string":
+            # Mixed object columns keep per-value type dispatch
+            literals = np.array([self._format_value(value) for value in series], dtype=str)
+        else:
+            # Escape single quotes in strings
+            escaped = np.char.replace(series.to_numpy(dtype=object).astype(str), "'", "''")
+            literals = np.char.add(np.char.add("'", escaped), "'")
+
+        return np.where(null_mask, "NULL", literals)
+
+    def _format_value(self, value: Any) -> str:
+        """
+        Format a single value for SQL INSERT.
+
+        Args:
+            value: Cell value
+
+        Returns:
+            SQL literal
+        """
+        if pd.isna(value):
+            return "NULL"
+        elif isinstance(value, (bool, np.bool_)):
+            return "TRUE" if value else "FALSE"
+        elif isinstance(value, (int, float)):
+            return str(value)
+        else:
+            # Escape single quotes in strings
+            str_value = str(value).replace("'", "''")
+            return f"'{str_value}'"
 
     def get_extension(self) -> str:
         """Get file extension."""
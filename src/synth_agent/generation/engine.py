@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from faker import Faker
 from mimesis import Generic
 
@@ -13,6 +14,28 @@ from synth_agent.core.config import Config
 from synth_agent.core.exceptions import ConstraintViolationError, DataGenerationError
 
 
+# Field types (exact, lowercased) that generate_arrow can produce without
+# pandas or Faker, mapped to the kind of column drawn for them
+ARROW_NATIVE_TYPES = {
+    "int": "int",
+    "integer": "int",
+    "int32": "int",
+    "int64": "int",
+    "bigint": "int",
+    "smallint": "int",
+    "float": "float",
+    "float32": "float",
+    "float64": "float",
+    "double": "float",
+    "decimal": "float",
+    "bool": "bool",
+    "boolean": "bool",
+    "date": "date",
+    "datetime": "datetime",
+    "timestamp": "datetime",
+}
+
+
 class DataGenerationEngine:
     """Core engine for generating synthetic data."""
 
@@ -30,6 +53,7 @@ class DataGenerationEngine:
         self.mimesis = Generic(locale)
         self.locale = locale
         self.seed = seed
+        self.rng = np.random.default_rng(seed)
 
         # Set seed for reproducibility if configured
         if seed is not None:
@@ -61,6 +85,12 @@ class DataGenerationEngine:
             self._validate_schema(schema)
             self._validate_num_rows(num_rows)
 
+            # Numeric/boolean/temporal schemas are drawn as whole arrays
+            if not pattern_analysis and self._uses_arrow_path(schema):
+                df = self.generate_arrow(schema, num_rows).to_pandas()
+                self._validate_generated_data(df, schema)
+                return df
+
             # Extract fields
             fields = schema.get("fields", [])
 
@@ -90,6 +120,111 @@ class DataGenerationEngine:
         except Exception as e:
             raise DataGenerationError(f"Failed to generate data: {e}")
 
+    def generate_arrow(self, schema: Dict[str, Any], num_rows: int) -> pa.Table:
+        """
+        Generate a numeric/boolean/temporal schema directly as an Arrow table.
+
+        Columns are drawn as NumPy arrays and wrapped with ``pa.array`` without
+        building a DataFrame, so they can be written with
+        ``ParquetFormatter.export_arrow`` without an extra pandas copy. Semantic
+        name matching is not applied on this path; ``generate`` delegates here
+        only for schemas where no field name has a semantic match.
+
+        Args:
+            schema: Data schema definition (see ``is_arrow_native``)
+            num_rows: Number of rows to generate
+
+        Returns:
+            Arrow table with generated data
+
+        Raises:
+            DataGenerationError: If the schema is not Arrow-native or generation fails
+        """
+        try:
+            self._validate_schema(schema)
+            self._validate_num_rows(num_rows)
+
+            if not self.is_arrow_native(schema):
+                raise DataGenerationError(
+                    "Arrow generation only supports numeric, boolean and date/time fields"
+                )
+
+            quality = schema.get("quality_controls", {})
+            null_pct = quality.get("null_percentage", self.config.generation.null_percentage)
+            dup_pct = quality.get("duplicate_percentage", self.config.generation.duplicate_percentage)
+
+            dup_indices = source_indices = None
+            num_dups = int(num_rows * dup_pct)
+            if dup_pct > 0 and num_dups > 0:
+                dup_indices = self.rng.choice(num_rows, num_dups, replace=False)
+                source_indices = self.rng.choice(num_rows, num_dups, replace=True)
+
+            names = []
+            arrays = []
+            for field in schema["fields"]:
+                values = self._generate_arrow_column(field, num_rows)
+                if dup_indices is not None:
+                    values[dup_indices] = values[source_indices]
+                mask = self.rng.random(num_rows) < null_pct if null_pct > 0 else None
+                names.append(field["name"])
+                arrays.append(pa.array(values, mask=mask))
+
+            return pa.Table.from_arrays(arrays, names=names)
+
+        except DataGenerationError:
+            raise
+        except Exception as e:
+            raise DataGenerationError(f"Failed to generate data: {e}")
+
+    @staticmethod
+    def is_arrow_native(schema: Dict[str, Any]) -> bool:
+        """
+        Check whether every field can be generated by ``generate_arrow``.
+
+        Args:
+            schema: Data schema definition
+
+        Returns:
+            True if all fields are numeric, boolean, date or datetime typed
+        """
+        fields = schema.get("fields", [])
+        return bool(fields) and all(
+            not field.get("constraints")
+            and field.get("type", "string").lower() in ARROW_NATIVE_TYPES
+            for field in fields
+        )
+
+    def _uses_arrow_path(self, schema: Dict[str, Any]) -> bool:
+        """Check whether ``generate`` can delegate a schema to ``generate_arrow``."""
+        if not self.is_arrow_native(schema):
+            return False
+        if not self.config.generation.use_semantic_analysis:
+            return True
+        # A zero-row probe returns None only when no semantic generator matches
+        return all(
+            self._generate_semantic(field["name"], field.get("type", "string"), 0) is None
+            for field in schema["fields"]
+        )
+
+    def _generate_arrow_column(self, field: Dict[str, Any], num_rows: int) -> np.ndarray:
+        """Generate a single Arrow-native column as a NumPy array."""
+        kind = ARROW_NATIVE_TYPES[field.get("type", "string").lower()]
+
+        if kind == "int":
+            return self.rng.integers(field.get("min", 0), field.get("max", 1000000), num_rows, endpoint=True)
+
+        if kind == "float":
+            return self.rng.uniform(field.get("min", 0.0), field.get("max", 1000.0), num_rows)
+
+        if kind == "bool":
+            return self.rng.random(num_rows) < 0.5
+
+        # Day precision stored as datetime64[s] to match the DataFrame path's dtype
+        if kind == "date":
+            return self._random_datetimes(num_rows, years=10, unit="D").astype("datetime64[s]")
+
+        return self._random_datetimes(num_rows, years=1, unit="s")
+
     def _generate_field(
         self,
         field: Dict[str, Any],
@@ -110,7 +245,7 @@ class DataGenerationEngine:
         # Use semantic analysis if enabled
         if self.config.generation.use_semantic_analysis:
             semantic_data = self._generate_semantic(field_name, field_type, num_rows)
-            if semantic_data:
+            if semantic_data is not None:
                 return semantic_data
 
         # Fall back to type-based generation
@@ -152,11 +287,11 @@ class DataGenerationEngine:
 
         # Date/Time patterns
         if "date" in name_lower or "birth" in name_lower:
-            return [self.faker.date_between(start_date="-30y", end_date="today") for _ in range(num_rows)]
+            return self._random_datetimes(num_rows, years=30, unit="D")
         if "time" in name_lower:
             return [self.faker.time() for _ in range(num_rows)]
         if "datetime" in name_lower or "timestamp" in name_lower:
-            return [self.faker.date_time_between(start_date="-1y", end_date="now") for _ in range(num_rows)]
+            return self._random_datetimes(num_rows, years=1, unit="s")
 
         # Company/Business patterns
         if "company" in name_lower or "organization" in name_lower:
@@ -217,16 +352,36 @@ class DataGenerationEngine:
 
         # Date types
         if "date" in type_lower and "time" not in type_lower:
-            return [self.faker.date_between(start_date="-10y", end_date="today") for _ in range(num_rows)]
+            return self._random_datetimes(num_rows, years=10, unit="D")
 
         # DateTime types
         if "datetime" in type_lower or "timestamp" in type_lower:
-            return [self.faker.date_time_between(start_date="-1y", end_date="now") for _ in range(num_rows)]
+            return self._random_datetimes(num_rows, years=1, unit="s")
 
         # String/Text types (default)
         max_length = field.get("max_length", 50)
         return [self.faker.pystr(max_chars=max_length) for _ in range(num_rows)]
 
+    def _random_datetimes(self, num_rows: int, years: int, unit: str) -> np.ndarray:
+        """
+        Draw uniformly distributed timestamps from the last ``years`` years.
+
+        Offsets are drawn as int64 ticks and added to a ``datetime64`` origin, so
+        no per-row ``date``/``datetime`` objects are created.
+
+        Args:
+            num_rows: Number of values to generate
+            years: Size of the trailing window ending now
+            unit: NumPy datetime unit ("D" for dates, "s" for datetimes)
+
+        Returns:
+            ``datetime64[unit]`` array
+        """
+        end = np.datetime64("now", unit)
+        span = np.timedelta64(int(years * 365.25 * 86400), "s").astype(f"timedelta64[{unit}]")
+        offsets = self.rng.integers(0, span.astype(np.int64) + 1, num_rows)
+        return (end - span) + offsets.astype(f"timedelta64[{unit}]")
+
     def _find_pattern_field(
         self, field_name: str, pattern_analysis: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -318,10 +473,13 @@ class DataGenerationEngine:
         if dup_pct > 0:
             num_dups = int(len(df) * dup_pct)
             if num_dups > 0:
-                dup_indices = np.random.choice(len(df), num_dups, replace=False)
-                source_indices = np.random.choice(len(df), num_dups, replace=True)
-                for dup_idx, src_idx in zip(dup_indices, source_indices):
-                    df.iloc[dup_idx] = df.iloc[src_idx]
+                dup_indices = self.rng.choice(len(df), num_dups, replace=False)
+                source_indices = self.rng.choice(len(df), num_dups, replace=True)
+                # Copy whole rows with one fancy-indexed assignment per column
+                for col in df.columns:
+                    values = df[col].array.copy()
+                    values[dup_indices] = values.take(source_indices)
+                    df[col] = values
 
         return df
 
@@ -8,8 +8,12 @@ Modes:
 - balanced: Mix of typical and edge cases
 """
 
-from typing import Dict, Any, Optional
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from enum import Enum
+import numpy as np
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -23,6 +27,15 @@ class GenerationMode(str, Enum):
     BALANCED = "balanced"
 
 
+@lru_cache(maxsize=16)
+def _coerce_mode(mode_str: str) -> Optional[GenerationMode]:
+    """Convert a mode string to a GenerationMode, or None if it is not a valid mode."""
+    try:
+        return GenerationMode(mode_str)
+    except ValueError:
+        return None
+
+
 class GenerationModeConfig:
     """
     Configuration for different generation modes.
@@ -70,29 +83,36 @@ class GenerationModeConfig:
             "use_case": "General purpose synthetic data with good coverage",
         },
     }
+    # Freeze each mode so lookups can hand out the shared mapping without copying
+    MODES = {mode: MappingProxyType(config) for mode, config in MODES.items()}
 
     @classmethod
-    def get_mode_config(cls, mode: GenerationMode | str) -> Dict[str, Any]:
+    def get_mode_config(
+        cls, mode: GenerationMode | str, mutable: bool = False
+    ) -> Mapping[str, Any]:
         """
         Get configuration for a specific generation mode.
 
         Args:
             mode: Generation mode
+            mutable: Return a private ``dict`` copy instead of the shared read-only view
 
         Returns:
-            Mode configuration dictionary
+            Mode configuration mapping
         """
         if isinstance(mode, str):
-            try:
-                mode = GenerationMode(mode)
-            except ValueError:
+            coerced = _coerce_mode(mode)
+            if coerced is None:
                 logger.warning(f"Invalid mode: {mode}, using balanced")
-                mode = GenerationMode.BALANCED
+                coerced = GenerationMode.BALANCED
+            mode = coerced
 
         config = cls.MODES.get(mode, cls.MODES[GenerationMode.BALANCED])
-        logger.info("Retrieved mode config", mode=mode.value, name=config["name"])
+        logger.debug("Retrieved mode config", mode=mode.value, name=config["name"])
 
-        return config.copy()
+        if mutable:
+            return dict(config)
+        return config
 
     @classmethod
     def list_modes(cls) -> Dict[str, Dict[str, Any]]:
@@ -117,6 +137,17 @@ class ModeAwareGenerator:
     Wrapper that applies mode-specific adjustments to data generation.
     """
 
+    __slots__ = (
+        "mode",
+        "config",
+        "_variance_mult",
+        "_outlier_freq",
+        "_edge_freq",
+        "_include_outliers",
+        "_dist_fidelity",
+        "_mask_cache",
+    )
+
     def __init__(self, mode: GenerationMode | str = GenerationMode.BALANCED):
         """
         Initialize mode-aware generator.
@@ -127,6 +158,14 @@ class ModeAwareGenerator:
         self.mode = mode if isinstance(mode, GenerationMode) else GenerationMode(mode)
         self.config = GenerationModeConfig.get_mode_config(self.mode)
 
+        # Derived scalars used on per-row paths
+        self._variance_mult: float = self.config["variance_multiplier"]
+        self._include_outliers: bool = self.config["include_outliers"]
+        self._dist_fidelity: float = self.config["distribution_fidelity"]
+        self._outlier_freq = max(1, int(1.0 / max(self.config["outlier_ratio"], 0.01)))
+        self._edge_freq = max(1, int(1.0 / max(self.config["edge_case_ratio"], 0.01)))
+        self._mask_cache: Dict[Tuple[str, int], np.ndarray] = {}
+
         logger.info("ModeAwareGenerator initialized", mode=self.mode.value)
 
     def adjust_parameters(self, base_params: Dict[str, Any]) -> Dict[str, Any]:
@@ -143,7 +182,7 @@ class ModeAwareGenerator:
 
         # Apply variance multiplier
         if "variance" in adjusted:
-            adjusted["variance"] *= self.config["variance_multiplier"]
+            adjusted["variance"] *= self._variance_mult
 
         # Apply outlier settings
         adjusted["include_outliers"] = self.config["include_outliers"]
@@ -153,12 +192,12 @@ class ModeAwareGenerator:
         adjusted["edge_case_ratio"] = self.config["edge_case_ratio"]
 
         # Apply distribution fidelity
-        adjusted["distribution_fidelity"] = self.config["distribution_fidelity"]
+        adjusted["distribution_fidelity"] = self._dist_fidelity
 
         logger.debug(
             "Parameters adjusted",
             mode=self.mode.value,
-            variance_mult=self.config["variance_multiplier"],
+            variance_mult=self._variance_mult,
         )
 
         return adjusted
@@ -175,12 +214,8 @@ class ModeAwareGenerator:
         Returns:
             True if should generate outlier
         """
-        if not self.config["include_outliers"]:
-            return False
-
         # Use deterministic approach based on row index
-        outlier_frequency = int(1.0 / max(self.config["outlier_ratio"], 0.01))
-        return row_index % outlier_frequency == 0
+        return self._include_outliers and row_index % self._outlier_freq == 0
 
     def should_generate_edge_case(self, field_name: str, row_index: int, total_rows: int) -> bool:
         """
@@ -194,16 +229,81 @@ class ModeAwareGenerator:
         Returns:
             True if should generate edge case
         """
-        edge_case_frequency = int(1.0 / max(self.config["edge_case_ratio"], 0.01))
-        return row_index % edge_case_frequency == 0
+        return row_index % self._edge_freq == 0
+
+    def should_generate_outlier_batch(self, total_rows: int) -> np.ndarray:
+        """
+        Get the outlier flags for every row at once.
+
+        Args:
+            total_rows: Total number of rows
+
+        Returns:
+            Read-only boolean array, True where a row should be an outlier
+        """
+        return self._outlier_mask(total_rows)
+
+    def should_generate_edge_case_batch(self, total_rows: int) -> np.ndarray:
+        """
+        Get the edge case flags for every row at once.
+
+        Args:
+            total_rows: Total number of rows
+
+        Returns:
+            Read-only boolean array, True where a row should be an edge case
+        """
+        return self._edge_case_mask(total_rows)
+
+    def _outlier_mask(self, total_rows: int) -> np.ndarray:
+        """Build (or reuse) the outlier bitmap for ``total_rows`` rows."""
+        frequency = self._outlier_freq if self._include_outliers else None
+        return self._row_mask("outlier", total_rows, frequency)
+
+    def _edge_case_mask(self, total_rows: int) -> np.ndarray:
+        """Build (or reuse) the edge case bitmap for ``total_rows`` rows."""
+        return self._row_mask("edge_case", total_rows, self._edge_freq)
+
+    def _row_mask(self, kind: str, total_rows: int, frequency: Optional[int]) -> np.ndarray:
+        """Flag every ``frequency``-th row by index; a frequency of None flags none."""
+        key = (kind, total_rows)
+        mask = self._mask_cache.get(key)
+        if mask is None:
+            if frequency is None:
+                mask = np.zeros(total_rows, dtype=bool)
+            else:
+                mask = np.arange(total_rows) % frequency == 0
+            mask.flags.writeable = False
+            self._mask_cache[key] = mask
+        return mask
 
     def get_variance_multiplier(self) -> float:
         """Get variance multiplier for this mode."""
-        return self.config["variance_multiplier"]
+        return self._variance_mult
 
     def get_distribution_fidelity(self) -> float:
         """Get distribution fidelity target for this mode."""
-        return self.config["distribution_fidelity"]
+        return self._dist_fidelity
+
+
+# Use-case keywords for auto-selection; earlier modes in _USE_CASE_PRIORITY win
+_USE_CASE_KEYWORDS = {
+    "test": GenerationMode.EDGE_CASE,
+    "edge": GenerationMode.EDGE_CASE,
+    "stress": GenerationMode.EDGE_CASE,
+    "exact": GenerationMode.EXACT_MATCH,
+    "match": GenerationMode.EXACT_MATCH,
+    "precise": GenerationMode.EXACT_MATCH,
+    "variant": GenerationMode.REALISTIC_VARIANT,
+    "diverse": GenerationMode.REALISTIC_VARIANT,
+}
+_USE_CASE_PRIORITY = (
+    GenerationMode.EDGE_CASE,
+    GenerationMode.EXACT_MATCH,
+    GenerationMode.REALISTIC_VARIANT,
+)
+# Lookahead so overlapping keywords are all found, matching plain substring checks
+_USE_CASE_KEYWORD_RE = re.compile(f"(?=({'|'.join(_USE_CASE_KEYWORDS)}))")
 
 
 def select_mode_from_requirements(requirements: Dict[str, Any]) -> GenerationMode:
@@ -219,22 +319,18 @@ def select_mode_from_requirements(requirements: Dict[str, Any]) -> GenerationMod
     # Check for explicit mode request
     if "generation_mode" in requirements:
         mode_str = requirements["generation_mode"]
-        try:
-            return GenerationMode(mode_str)
-        except ValueError:
-            logger.warning(f"Invalid mode in requirements: {mode_str}")
+        mode = _coerce_mode(mode_str) if isinstance(mode_str, str) else None
+        if mode is not None:
+            return mode
+        logger.warning(f"Invalid mode in requirements: {mode_str}")
 
     # Auto-detect based on use case
     use_case = requirements.get("use_case", "").lower()
+    matched = {_USE_CASE_KEYWORDS[kw] for kw in _USE_CASE_KEYWORD_RE.findall(use_case)}
 
-    if "test" in use_case or "edge" in use_case or "stress" in use_case:
-        return GenerationMode.EDGE_CASE
-
-    if "exact" in use_case or "match" in use_case or "precise" in use_case:
-        return GenerationMode.EXACT_MATCH
-
-    if "variant" in use_case or "diverse" in use_case:
-        return GenerationMode.REALISTIC_VARIANT
+    for mode in _USE_CASE_PRIORITY:
+        if mode in matched:
+            return mode
 
     # Default to balanced
     return GenerationMode.BALANCED
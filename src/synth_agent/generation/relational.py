@@ -1,10 +1,15 @@
 """Relational data generation with foreign key support."""
 
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from synth_agent.core.exceptions import DataGenerationError
 
@@ -14,10 +19,18 @@ logger = logging.getLogger(__name__)
 class RelationalDataGenerator:
     """Generates relational datasets with foreign key constraints."""
 
-    def __init__(self):
-        """Initialize relational data generator."""
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize relational data generator.
+
+        Args:
+            seed: Optional seed for reproducibility. If None, uses random seed.
+        """
         self.tables: Dict[str, pd.DataFrame] = {}
         self.relationships: List[Dict[str, Any]] = []
+        self._root_rng = np.random.default_rng(seed)
+        self._local = threading.local()
+        self._column_cache: Dict[Tuple[str, str], np.ndarray] = {}
 
     def generate_relational_dataset(
         self,
@@ -50,27 +63,63 @@ class RelationalDataGenerator:
         # Validate relationships
         self._validate_relationships(table_schemas, relationships)
 
-        # Determine generation order (topological sort)
-        generation_order = self._get_generation_order(table_schemas, relationships)
+        # Determine generation levels (topological sort); tables within a
+        # level have no dependencies on each other
+        generation_levels = self._get_generation_levels(table_schemas, relationships)
 
-        # Generate tables in order
+        # Generate tables level by level
         self.tables = {}
+        self._column_cache.clear()
         self.relationships = relationships
 
-        for table_name in generation_order:
-            logger.info(f"Generating table: {table_name}")
-            schema = table_schemas[table_name]
-            num_rows = row_counts.get(table_name, 100)
+        for level in generation_levels:
+            # One child RNG per table, spawned in a fixed order, keeps seeded
+            # runs reproducible regardless of thread scheduling
+            jobs = [
+                (
+                    table_name,
+                    table_schemas[table_name],
+                    row_counts.get(table_name, 100),
+                    self._get_foreign_keys(table_name, relationships),
+                    rng,
+                )
+                for table_name, rng in zip(level, self._root_rng.spawn(len(level)))
+            ]
 
-            # Get foreign key constraints for this table
-            fk_constraints = self._get_foreign_keys(table_name, relationships)
+            if len(jobs) == 1:
+                results = [self._generate_table_job(*jobs[0])]
+            else:
+                max_workers = min(len(jobs), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(lambda job: self._generate_table_job(*job), jobs))
 
-            # Generate table data
-            df = self._generate_table(table_name, schema, num_rows, fk_constraints)
-            self.tables[table_name] = df
+            # Publish the level only after all of its tables are done
+            for table_name, df in zip(level, results):
+                self._set_table(table_name, df)
 
         return self.tables
 
+    def _generate_table_job(
+        self,
+        table_name: str,
+        schema: Dict[str, Any],
+        num_rows: int,
+        fk_constraints: List[Dict[str, Any]],
+        rng: np.random.Generator
+    ) -> pd.DataFrame:
+        """Generate one table using ``rng`` as this thread's generator."""
+        logger.info(f"Generating table: {table_name}")
+        self._local.rng = rng
+        try:
+            return self._generate_table(table_name, schema, num_rows, fk_constraints)
+        finally:
+            del self._local.rng
+
+    @property
+    def _rng(self) -> np.random.Generator:
+        """Random generator for the current thread (the root generator by default)."""
+        return getattr(self._local, "rng", self._root_rng)
+
     def _validate_relationships(
         self,
         table_schemas: Dict[str, Dict[str, Any]],
@@ -90,49 +139,44 @@ class RelationalDataGenerator:
             if rel["to_table"] not in table_schemas:
                 raise DataGenerationError(f"To table not found: {rel['to_table']}")
 
-    def _get_generation_order(
+    def _get_generation_levels(
         self,
         table_schemas: Dict[str, Dict[str, Any]],
         relationships: List[Dict[str, Any]]
-    ) -> List[str]:
+    ) -> List[List[str]]:
         """
-        Determine table generation order based on dependencies.
+        Group tables into dependency levels, parents first.
 
-        Uses topological sort to ensure parent tables are generated before children.
+        Every table's parents are in an earlier level, so the tables of one
+        level can be generated concurrently. Tables within a level are sorted
+        for deterministic ordering.
         """
-        # Build dependency graph
-        dependencies = {table: set() for table in table_schemas.keys()}
+        parents = {table: set() for table in table_schemas.keys()}
+        children: Dict[str, set] = {table: set() for table in table_schemas.keys()}
 
         for rel in relationships:
             # Child depends on parent
-            dependencies[rel["from_table"]].add(rel["to_table"])
-
-        # Topological sort using Kahn's algorithm
-        in_degree = {table: 0 for table in table_schemas.keys()}
-        for table, deps in dependencies.items():
-            for dep in deps:
-                in_degree[dep] += 1
-
-        queue = [table for table, degree in in_degree.items() if degree == 0]
-        result = []
-
-        while queue:
-            # Sort for deterministic ordering
-            queue.sort()
-            table = queue.pop(0)
-            result.append(table)
-
-            # Remove edges
-            for dep in dependencies[table]:
-                in_degree[dep] -= 1
-                if in_degree[dep] == 0:
-                    queue.append(dep)
-
-        if len(result) != len(table_schemas):
+            parents[rel["from_table"]].add(rel["to_table"])
+            children[rel["to_table"]].add(rel["from_table"])
+
+        remaining = {table: len(deps) for table, deps in parents.items()}
+        level = sorted(table for table, count in remaining.items() if count == 0)
+        levels = []
+
+        while level:
+            levels.append(level)
+            next_level = []
+            for table in level:
+                for child in children[table]:
+                    remaining[child] -= 1
+                    if remaining[child] == 0:
+                        next_level.append(child)
+            level = sorted(next_level)
+
+        if sum(len(level) for level in levels) != len(table_schemas):
             raise DataGenerationError("Circular dependency detected in relationships")
 
-        # Reverse to get parent-first order
-        return list(reversed(result))
+        return levels
 
     def _get_foreign_keys(
         self,
@@ -153,33 +197,81 @@ class RelationalDataGenerator:
         fk_constraints: List[Dict[str, Any]]
     ) -> pd.DataFrame:
         """Generate a single table with foreign key constraints."""
-        # Initialize empty DataFrame
-        df = pd.DataFrame()
+        # Collect columns first and build the DataFrame once
+        columns: Dict[str, Any] = {}
 
         # Generate each field
         fields = schema.get("fields", [])
 
+        # First constraint per column wins
+        fk_by_column: Dict[str, Dict[str, Any]] = {}
+        for fk in fk_constraints:
+            fk_by_column.setdefault(fk["from_column"], fk)
+
+        batched_keys = self._batch_many_to_one_keys(
+            num_rows,
+            [fk_by_column[f.get("name")] for f in fields if f.get("name") in fk_by_column],
+        )
+
         for field in fields:
             field_name = field.get("name")
 
             # Check if this field is a foreign key
-            fk = next(
-                (fk for fk in fk_constraints if fk["from_column"] == field_name),
-                None
-            )
+            fk = fk_by_column.get(field_name)
 
-            if fk:
+            if field_name in batched_keys:
+                columns[field_name] = batched_keys[field_name]
+            elif fk:
                 # Generate foreign key values
-                df[field_name] = self._generate_foreign_key_column(
+                columns[field_name] = self._generate_foreign_key_column(
                     num_rows, fk, schema
                 )
             else:
                 # Generate regular field (placeholder - would use main generator)
-                df[field_name] = self._generate_placeholder_column(
+                columns[field_name] = self._generate_placeholder_column(
                     num_rows, field
                 )
 
-        return df
+        # Store Arrow-backed columns to keep FK/string columns compact
+        return pd.DataFrame(columns, copy=False).convert_dtypes(dtype_backend="pyarrow")
+
+    def _batch_many_to_one_keys(
+        self,
+        num_rows: int,
+        fks: List[Dict[str, Any]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Draw many-to-one foreign keys that share a parent size in one RNG call.
+
+        Columns whose parents have the same row count get their index rows from
+        a single ``integers(size=(k, num_rows))`` draw. Columns that cannot be
+        grouped (or whose parent is missing/empty) are left to
+        ``_generate_foreign_key_column``.
+
+        Returns:
+            Mapping of column name to generated values for the batched columns
+        """
+        groups: Dict[int, List[Tuple[str, np.ndarray]]] = {}
+        for fk in fks:
+            if fk.get("relationship_type", "many_to_one") != "many_to_one":
+                continue
+            if fk["to_table"] not in self.tables:
+                continue
+            parent_values = self._parent_array(fk["to_table"], fk["to_column"])
+            if len(parent_values):
+                groups.setdefault(len(parent_values), []).append(
+                    (fk["from_column"], parent_values)
+                )
+
+        batched: Dict[str, np.ndarray] = {}
+        for parent_size, members in groups.items():
+            if len(members) < 2:
+                continue
+            index_matrix = self._rng.integers(0, parent_size, size=(len(members), num_rows))
+            for row, (column, parent_values) in enumerate(members):
+                batched[column] = parent_values[index_matrix[row]]
+
+        return batched
 
     def _generate_foreign_key_column(
         self,
@@ -198,7 +290,7 @@ class RelationalDataGenerator:
                 f"Parent table '{parent_table}' must be generated before '{fk['from_table']}'"
             )
 
-        parent_values = self.tables[parent_table][parent_column].values
+        parent_values = self._parent_array(parent_table, parent_column)
 
         if len(parent_values) == 0:
             raise DataGenerationError(f"Parent table '{parent_table}' is empty")
@@ -206,7 +298,7 @@ class RelationalDataGenerator:
         # Generate based on relationship type
         if relationship_type == "many_to_one":
             # Multiple child records can reference the same parent
-            return np.random.choice(parent_values, size=num_rows, replace=True)
+            return self._draw_with_replacement(parent_values, num_rows)
 
         elif relationship_type == "one_to_one":
             # Each child record references a unique parent
@@ -215,9 +307,9 @@ class RelationalDataGenerator:
                     f"One-to-one relationship but child has more rows ({num_rows}) than parent ({len(parent_values)}). "
                     "Reusing parent values."
                 )
-                return np.random.choice(parent_values, size=num_rows, replace=True)
+                return self._draw_with_replacement(parent_values, num_rows)
             else:
-                return np.random.choice(parent_values, size=num_rows, replace=False)
+                return self._rng.choice(parent_values, size=num_rows, replace=False)
 
         elif relationship_type == "many_to_many":
             # Would typically need a junction table
@@ -225,16 +317,20 @@ class RelationalDataGenerator:
                 "Many-to-many relationships require a junction table. "
                 "Treating as many-to-one for this column."
             )
-            return np.random.choice(parent_values, size=num_rows, replace=True)
+            return self._draw_with_replacement(parent_values, num_rows)
 
         else:
             raise DataGenerationError(f"Unknown relationship type: {relationship_type}")
 
+    def _draw_with_replacement(self, values: np.ndarray, size: int) -> np.ndarray:
+        """Sample ``size`` values uniformly with replacement by drawing indices."""
+        return values[self._rng.integers(0, len(values), size=size)]
+
     def _generate_placeholder_column(
         self,
         num_rows: int,
         field: Dict[str, Any]
-    ) -> np.ndarray:
+    ) -> Any:
         """
         Generate placeholder column values.
 
@@ -244,14 +340,21 @@ class RelationalDataGenerator:
         field_type = field.get("type", "string")
 
         if field_type in ["integer", "int"]:
-            return np.random.randint(1, 10000, size=num_rows)
+            return self._rng.integers(1, 10000, size=num_rows, dtype=np.int64)
         elif field_type in ["float", "decimal"]:
-            return np.random.uniform(0, 1000, size=num_rows)
+            # Fill a preallocated buffer and scale in place
+            values = np.empty(num_rows, dtype=np.float64)
+            self._rng.random(out=values)
+            values *= 1000
+            return values
         elif field_type == "boolean":
-            return np.random.choice([True, False], size=num_rows)
+            return self._rng.random(num_rows) < 0.5
         else:
-            # String type
-            return np.array([f"value_{i}" for i in range(num_rows)])
+            # String type: "value_<i>" built by Arrow compute, no per-row Python strings
+            labels = pc.binary_join_element_wise(
+                "value_", pc.cast(pa.array(np.arange(num_rows)), pa.string()), ""
+            )
+            return pd.array(labels, dtype="string[pyarrow]")
 
     def add_junction_table(
         self,
@@ -279,20 +382,44 @@ class RelationalDataGenerator:
         if left_table not in self.tables or right_table not in self.tables:
             raise DataGenerationError("Both tables must exist before creating junction table")
 
-        left_values = self.tables[left_table][left_column].values
-        right_values = self.tables[right_table][right_column].values
+        left_values = self._parent_array(left_table, left_column)
+        right_values = self._parent_array(right_table, right_column)
 
-        # Generate random many-to-many relationships
-        left_refs = np.random.choice(left_values, size=num_relationships, replace=True)
-        right_refs = np.random.choice(right_values, size=num_relationships, replace=True)
+        # Factorize so equal parent values share a code; nulls get a code of
+        # their own so a null reference stays null instead of wrapping to -1
+        left_codes, left_uniques = pd.factorize(left_values, use_na_sentinel=False)
+        right_codes, right_uniques = pd.factorize(right_values, use_na_sentinel=False)
 
-        junction_df = pd.DataFrame({
-            f"{left_table}_{left_column}": left_refs,
-            f"{right_table}_{right_column}": right_refs
-        })
+        # Generate random many-to-many relationships as code pairs
+        left_refs = self._draw_with_replacement(left_codes, num_relationships)
+        right_refs = self._draw_with_replacement(right_codes, num_relationships)
+
+        # Remove duplicates to ensure unique relationships: pack each pair into
+        # one integer and keep first occurrences in draw order
+        num_right = np.uint64(len(right_uniques))
+        packed = left_refs.astype(np.uint64) * num_right + right_refs.astype(np.uint64)
+        _, first_seen = np.unique(packed, return_index=True)
+        first_seen.sort()
 
-        # Remove duplicates to ensure unique relationships
-        junction_df = junction_df.drop_duplicates()
+        junction_df = pd.DataFrame({
+            f"{left_table}_{left_column}": left_uniques[left_refs[first_seen]],
+            f"{right_table}_{right_column}": right_uniques[right_refs[first_seen]]
+        }).convert_dtypes(dtype_backend="pyarrow")
 
-        self.tables[table_name] = junction_df
+        self._set_table(table_name, junction_df)
         return junction_df
+
+    def _set_table(self, table_name: str, df: pd.DataFrame) -> None:
+        """Store a generated table and drop cached column arrays for it."""
+        self.tables[table_name] = df
+        for key in [key for key in self._column_cache if key[0] == table_name]:
+            del self._column_cache[key]
+
+    def _parent_array(self, table_name: str, column: str) -> np.ndarray:
+        """Get a (cached) NumPy view of a generated table's column."""
+        key = (table_name, column)
+        values = self._column_cache.get(key)
+        if values is None:
+            values = self.tables[table_name][column].to_numpy(copy=False)
+            self._column_cache[key] = values
+        return values
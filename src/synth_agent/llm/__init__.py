@@ -12,6 +12,7 @@ from synth_agent.llm.prompts import (
     REQUIREMENT_SUMMARY_PROMPT,
     SCHEMA_GENERATION_PROMPT,
     SYSTEM_PROMPT,
+    SYSTEM_PROMPT_BYTES,
     VALIDATION_PROMPT,
     format_prompt,
 )
@@ -25,6 +26,7 @@ __all__ = [
     "LLMManager",
     "create_llm_manager",
     "SYSTEM_PROMPT",
+    "SYSTEM_PROMPT_BYTES",
     "REQUIREMENT_EXTRACTION_PROMPT",
     "AMBIGUITY_DETECTION_PROMPT",
     "QUESTION_GENERATION_PROMPT",
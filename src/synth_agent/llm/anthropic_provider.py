@@ -2,12 +2,44 @@
 Anthropic LLM provider implementation.
 """
 
-from typing import Any, List
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from anthropic import AsyncAnthropic, AnthropicError
+import httpx
+from anthropic import AsyncAnthropic, AnthropicError, DefaultAsyncHttpxClient
 
 from synth_agent.core.exceptions import LLMError, LLMProviderError, LLMTimeoutError
-from synth_agent.llm.base import BaseLLMProvider, LLMMessage, LLMResponse
+from synth_agent.llm.base import (
+    BaseLLMProvider,
+    LLMMessage,
+    LLMResponse,
+    drop_closed_loop_clients,
+    get_retry_after,
+    running_loop,
+)
+
+
+# Clients shared by every provider with the same credentials so the
+# connection pool (and its keep-alive connections) survives across instances.
+# Pools are bound to the event loop that opened them, so the loop is part of the key
+_CLIENT_CACHE: Dict[Tuple[str, int, Optional[asyncio.AbstractEventLoop]], AsyncAnthropic] = {}
+
+
+def _get_client(api_key: str, timeout: int) -> AsyncAnthropic:
+    """Get the shared AsyncAnthropic client for an API key, timeout and running loop."""
+    key = (api_key, timeout, running_loop())
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        drop_closed_loop_clients(_CLIENT_CACHE)
+        client = AsyncAnthropic(
+            api_key=api_key,
+            timeout=timeout,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+            ),
+        )
+        _CLIENT_CACHE[key] = client
+    return client
 
 
 class AnthropicProvider(BaseLLMProvider):
@@ -34,7 +66,11 @@ class AnthropicProvider(BaseLLMProvider):
             **kwargs: Additional Anthropic parameters
         """
         super().__init__(api_key, model, temperature, max_tokens, timeout, **kwargs)
-        self.client = AsyncAnthropic(api_key=api_key, timeout=timeout)
+
+    @property
+    def client(self) -> AsyncAnthropic:
+        """Shared AsyncAnthropic client for the running event loop."""
+        return _get_client(self.api_key, self.timeout)
 
     async def complete(self, prompt: str, **kwargs: Any) -> LLMResponse:
         """
@@ -47,8 +83,8 @@ class AnthropicProvider(BaseLLMProvider):
         Returns:
             LLMResponse with generated content
         """
-        messages = [LLMMessage(role="user", content=prompt)]
-        return await self.chat(messages, **kwargs)
+        # Single user turn: skip the LLMMessage round-trip and system-message scan
+        return await self._raw_chat(None, [{"role": "user", "content": prompt}], kwargs)
 
     async def chat(self, messages: List[LLMMessage], **kwargs: Any) -> LLMResponse:
         """
@@ -61,38 +97,36 @@ class AnthropicProvider(BaseLLMProvider):
         Returns:
             LLMResponse with generated content
         """
-        try:
-            # Merge kwargs with defaults
-            params = {
-                "model": kwargs.get("model", self.model),
-                "temperature": kwargs.get("temperature", self.temperature),
-                "max_tokens": kwargs.get("max_tokens", self.max_tokens),
-                **{k: v for k, v in kwargs.items() if k not in ["model", "temperature", "max_tokens"]},
-            }
+        system_message, user_messages = self._split_messages(messages)
+        return await self._raw_chat(system_message, user_messages, kwargs)
 
-            # Separate system messages from other messages
-            system_message = None
-            user_messages = []
+    async def _raw_chat(
+        self,
+        system_message: Optional[str],
+        user_messages: List[Dict[str, str]],
+        kwargs: Dict[str, Any],
+    ) -> LLMResponse:
+        """
+        Call the Messages API with already formatted messages.
 
-            for msg in messages:
-                if msg.role == "system":
-                    system_message = msg.content
-                else:
-                    user_messages.append({"role": msg.role, "content": msg.content})
+        Args:
+            system_message: Optional system prompt
+            user_messages: Formatted user/assistant messages
+            kwargs: Per-call overrides of the provider defaults
 
-            # Add system message to params if present
-            if system_message:
-                params["system"] = system_message
+        Returns:
+            LLMResponse with generated content
+        """
+        try:
+            params = self._build_params(system_message, user_messages, kwargs)
 
             # Make API call
-            response = await self.client.messages.create(messages=user_messages, **params)
+            response = await self.client.messages.create(**params)
 
             # Extract response
-            content = ""
-            if response.content:
-                for block in response.content:
-                    if hasattr(block, "text"):
-                        content += block.text
+            content = "".join(
+                block.text for block in (response.content or ()) if hasattr(block, "text")
+            )
 
             usage = {
                 "prompt_tokens": response.usage.input_tokens,
@@ -113,30 +147,107 @@ class AnthropicProvider(BaseLLMProvider):
         except TimeoutError as e:
             raise LLMTimeoutError(f"Anthropic request timed out: {e}")
         except AnthropicError as e:
-            raise LLMProviderError(f"Anthropic API error: {e}")
+            raise LLMProviderError(f"Anthropic API error: {e}", retry_after=get_retry_after(e))
         except Exception as e:
             raise LLMError(f"Unexpected error in Anthropic provider: {e}")
 
+    async def stream(self, messages: List[LLMMessage], **kwargs: Any) -> AsyncIterator[str]:
+        """
+        Stream response text for a conversation as it is generated.
+
+        Args:
+            messages: List of conversation messages
+            **kwargs: Additional parameters
+
+        Yields:
+            Text chunks in generation order
+        """
+        try:
+            system_message, user_messages = self._split_messages(messages)
+            params = self._build_params(system_message, user_messages, kwargs)
+
+            async with self.client.messages.stream(**params) as response_stream:
+                async for text in response_stream.text_stream:
+                    yield text
+
+        except TimeoutError as e:
+            raise LLMTimeoutError(f"Anthropic request timed out: {e}")
+        except AnthropicError as e:
+            raise LLMProviderError(f"Anthropic API error: {e}", retry_after=get_retry_after(e))
+        except Exception as e:
+            raise LLMError(f"Unexpected error in Anthropic provider: {e}")
+
+    def _split_messages(
+        self, messages: List[LLMMessage]
+    ) -> Tuple[Optional[str], List[Dict[str, str]]]:
+        """
+        Separate the system prompt from conversation messages.
+
+        Args:
+            messages: List of conversation messages
+
+        Returns:
+            Tuple of (system prompt or None, formatted user/assistant messages)
+        """
+        system_message = None
+        user_messages = []
+
+        for msg in messages:
+            if msg.role == "system":
+                system_message = msg.content
+            else:
+                user_messages.append({"role": msg.role, "content": msg.content})
+
+        return system_message, user_messages
+
+    def _build_params(
+        self,
+        system_message: Optional[str],
+        user_messages: List[Dict[str, str]],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Build Messages API request parameters.
+
+        Args:
+            system_message: Optional system prompt
+            user_messages: Formatted user/assistant messages
+            kwargs: Per-call overrides of the provider defaults
+
+        Returns:
+            Keyword arguments for ``messages.create``/``messages.stream``
+        """
+        # Merge kwargs with defaults
+        params = {
+            "model": kwargs.get("model", self.model),
+            "temperature": kwargs.get("temperature", self.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.max_tokens),
+            **{k: v for k, v in kwargs.items() if k not in ["model", "temperature", "max_tokens"]},
+        }
+
+        # Add system message to params if present
+        if system_message:
+            params["system"] = system_message
+
+        params["messages"] = user_messages
+        return params
+
     def validate_api_key(self) -> bool:
         """
         Validate the API key.
 
+        Lists models with a synchronous request, so no event loop is started
+        and no tokens are consumed.
+
         Returns:
             True if valid, False otherwise
         """
         try:
-            # Simple validation by making a minimal request
-            import asyncio
-
-            async def _validate() -> bool:
-                try:
-                    await self.client.messages.create(
-                        model=self.model, max_tokens=10, messages=[{"role": "user", "content": "Hi"}]
-                    )
-                    return True
-                except Exception:
-                    return False
-
-            return asyncio.run(_validate())
+            response = httpx.get(
+                str(self.client.base_url.join("v1/models")),
+                headers={"x-api-key": self.api_key, "anthropic-version": "2023-06-01"},
+                timeout=self.timeout,
+            )
+            return response.status_code == 200
         except Exception:
             return False
@@ -2,9 +2,11 @@
 Base abstract class for LLM providers.
 """
 
+import asyncio
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -15,6 +17,10 @@ class LLMMessage:
     content: str
     metadata: Optional[Dict[str, Any]] = None
 
+    def __post_init__(self) -> None:
+        # Share one string object per role, including roles read from JSON
+        self.role = sys.intern(self.role)
+
 
 @dataclass
 class LLMResponse:
@@ -26,6 +32,56 @@ class LLMResponse:
     metadata: Optional[Dict[str, Any]] = None
 
 
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    Read the Retry-After delay from a provider SDK error, if it carries one.
+
+    Args:
+        error: Exception raised by the provider SDK
+
+    Returns:
+        Delay in seconds, or None if the response had no usable header
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+def running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """
+    Get the running event loop, if any.
+
+    Returns:
+        The running loop, or None when called outside one
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def drop_closed_loop_clients(
+    cache: Dict[Tuple[str, int, Optional[asyncio.AbstractEventLoop]], Any]
+) -> None:
+    """
+    Remove shared SDK clients whose event loop has closed.
+
+    An httpx connection pool is bound to the loop that opened its
+    connections, so clients are cached per loop and cannot outlive it.
+
+    Args:
+        cache: Client cache keyed on ``(api_key, timeout, loop)``
+    """
+    for key in [key for key in cache if key[2] is not None and key[2].is_closed()]:
+        del cache[key]
+
+
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
@@ -84,6 +140,22 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def stream(self, messages: List[LLMMessage], **kwargs: Any) -> AsyncIterator[str]:
+        """
+        Stream response text for a conversation as it is generated.
+
+        Providers without native streaming yield the full response once.
+
+        Args:
+            messages: List of conversation messages
+            **kwargs: Additional parameters
+
+        Yields:
+            Text chunks in generation order
+        """
+        response = await self.chat(messages, **kwargs)
+        yield response.content
+
     @abstractmethod
     def validate_api_key(self) -> bool:
         """
@@ -94,6 +166,15 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def validate_api_key_async(self) -> bool:
+        """
+        Validate the API key without blocking the running event loop.
+
+        Returns:
+            True if valid, False otherwise
+        """
+        return await asyncio.to_thread(self.validate_api_key)
+
     def format_messages(self, messages: List[LLMMessage]) -> List[Dict[str, str]]:
         """
         Format messages for the provider's API.
@@ -6,17 +6,47 @@ import asyncio
 import hashlib
 import json
 import logging
+import random
 import time
-from typing import Any, Dict, List, Optional
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, Optional, Tuple
 
 from synth_agent.core.config import Config
 from synth_agent.core.exceptions import ConfigurationError, LLMError, LLMProviderError
 from synth_agent.llm.anthropic_provider import AnthropicProvider
 from synth_agent.llm.base import BaseLLMProvider, LLMMessage, LLMResponse
 from synth_agent.llm.openai_provider import OpenAIProvider
+from synth_agent.llm.prompts import SYSTEM_PROMPT, SYSTEM_PROMPT_BYTES
 
 logger = logging.getLogger(__name__)
 
+# Prompts longer than this (in characters) are hashed in a worker thread so
+# the event loop is not blocked; hashlib releases the GIL for large buffers
+_OFFLOAD_HASH_CHARS = 64 * 1024
+
+
+@lru_cache(maxsize=128)
+def _serialize_params(frozen_params: FrozenSet[Tuple[str, type, Any]]) -> str:
+    """Serialize frozen request parameters to a stable JSON string."""
+    return json.dumps({name: value for name, _, value in frozen_params}, sort_keys=True)
+
+
+def _params_signature(params: Dict[str, Any]) -> str:
+    """
+    Get the stable JSON form of request parameters.
+
+    Parameter sets with only hashable values (the usual model/temperature/
+    max_tokens case) are memoized; the value type is part of the memo key so
+    ``1``, ``1.0`` and ``True`` stay distinct.
+    """
+    try:
+        frozen = frozenset((name, type(value), value) for name, value in params.items())
+    except TypeError:
+        return json.dumps(params, sort_keys=True)
+    return _serialize_params(frozen)
+
 
 class LLMManager:
     """Manages LLM interactions with retry logic and caching."""
@@ -37,7 +67,13 @@ class LLMManager:
         self.config = config
         self.enable_cache = enable_cache
         self.max_cache_size = max_cache_size
-        self._cache: Dict[str, tuple[LLMResponse, float]] = {}  # hash -> (response, timestamp)
+        # hash -> response, least to most recently used; insertion times
+        # (monotonic ns) live in a parallel map so entries need no tuple
+        self._cache: OrderedDict[bytes, LLMResponse] = OrderedDict()
+        self._cache_times: Dict[bytes, int] = {}
+        self._sweeper_task: Optional[asyncio.Task] = None
+        # cache key -> pending response for requests currently with the provider
+        self._inflight: Dict[bytes, asyncio.Future] = {}
         logger.info(f"Initialized LLM Manager with provider: {provider.__class__.__name__}, cache: {enable_cache}")
 
     async def complete(self, prompt: str, **kwargs: Any) -> LLMResponse:
@@ -52,8 +88,9 @@ class LLMManager:
             LLMResponse
         """
         # Check cache
-        if self.enable_cache:
-            cache_key = self._get_cache_key(prompt, kwargs)
+        cache_key = await self._compute_cache_key(len(prompt), self._get_cache_key, prompt, kwargs)
+        if cache_key is not None:
+            self._ensure_sweeper()
             cached_response = self._get_from_cache(cache_key)
             if cached_response:
                 logger.debug("Cache hit for completion request")
@@ -61,18 +98,29 @@ class LLMManager:
 
         # Attempt with retries
         logger.debug(f"Generating completion with prompt length: {len(prompt)}")
-        response = await self._retry_with_backoff(
-            lambda: self.provider.complete(prompt, **kwargs)
+        response = await self._request_once(
+            cache_key, lambda: self.provider.complete(prompt, **kwargs)
         )
         logger.info(f"Completion generated: {response.usage.get('total_tokens', 0)} tokens")
 
-        # Cache response
-        if self.enable_cache:
-            cache_key = self._get_cache_key(prompt, kwargs)
-            self._add_to_cache(cache_key, response)
-
         return response
 
+    async def complete_many(self, prompts: List[str], **kwargs: Any) -> List[LLMResponse]:
+        """
+        Generate completions for several prompts concurrently.
+
+        Requests run in parallel over the provider's shared connection pool and
+        go through the same cache, so repeated prompts are only sent once.
+
+        Args:
+            prompts: Input prompts
+            **kwargs: Additional parameters applied to every prompt
+
+        Returns:
+            LLMResponses in the same order as ``prompts``
+        """
+        return list(await asyncio.gather(*(self.complete(prompt, **kwargs) for prompt in prompts)))
+
     async def chat(self, messages: List[LLMMessage], **kwargs: Any) -> LLMResponse:
         """
         Generate chat response with retry logic.
@@ -85,21 +133,90 @@ class LLMManager:
             LLMResponse
         """
         # Check cache
-        if self.enable_cache:
-            cache_key = self._get_cache_key(str(messages), kwargs)
+        cache_key = await self._compute_cache_key(
+            sum(len(msg.content) for msg in messages),
+            self._get_messages_cache_key,
+            messages,
+            kwargs,
+        )
+        if cache_key is not None:
+            self._ensure_sweeper()
             cached_response = self._get_from_cache(cache_key)
             if cached_response:
                 return cached_response
 
         # Attempt with retries
-        response = await self._retry_with_backoff(lambda: self.provider.chat(messages, **kwargs))
+        return await self._request_once(cache_key, lambda: self.provider.chat(messages, **kwargs))
 
-        # Cache response
-        if self.enable_cache:
-            cache_key = self._get_cache_key(str(messages), kwargs)
-            self._add_to_cache(cache_key, response)
+    async def stream(self, messages: List[LLMMessage], **kwargs: Any) -> AsyncIterator[str]:
+        """
+        Stream a chat response as it is generated.
 
-        return response
+        Streamed responses bypass the cache and are not retried, since
+        chunks may already have been handed to the caller.
+
+        Args:
+            messages: Conversation messages
+            **kwargs: Additional parameters
+
+        Yields:
+            Text chunks in generation order
+        """
+        async for chunk in self.provider.stream(messages, **kwargs):
+            yield chunk
+
+    async def _request_once(self, cache_key: Optional[bytes], func: Any) -> LLMResponse:
+        """
+        Call the provider, sharing one call between identical concurrent requests.
+
+        Requests with the same cache key that arrive while the first is still
+        awaiting the provider wait for its result instead of issuing their own
+        call. The response is cached before waiters are released. If the
+        request making the call is cancelled, its waiters retry and the first
+        of them makes the call instead.
+
+        Args:
+            cache_key: Cache key, or None when caching is disabled
+            func: Async function performing the provider call
+
+        Returns:
+            LLMResponse
+        """
+        if cache_key is None:
+            return await self._retry_with_backoff(func)
+
+        pending = self._inflight.get(cache_key)
+        while pending is not None:
+            logger.debug("Joining in-flight request for identical prompt")
+            response = await asyncio.shield(pending)
+            if response is not None:
+                return response
+            # None means the calling request was cancelled: reuse the result of
+            # a waiter that already took over, join it, or take over
+            response = self._get_from_cache(cache_key)
+            if response is not None:
+                return response
+            pending = self._inflight.get(cache_key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            response = await self._retry_with_backoff(func)
+        except asyncio.CancelledError:
+            # Release waiters without cancelling them, so they can retry
+            future.set_result(None)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not reported twice
+            future.exception()
+            raise
+        else:
+            self._add_to_cache(cache_key, response)
+            future.set_result(response)
+            return response
+        finally:
+            del self._inflight[cache_key]
 
     async def _retry_with_backoff(self, func: Any) -> LLMResponse:
         """
@@ -127,8 +244,17 @@ class LLMManager:
             except LLMProviderError as e:
                 last_error = e
                 if attempt < max_retries:
-                    delay = retry_delays[min(attempt, len(retry_delays) - 1)]
-                    logger.warning(f"LLM call failed (attempt {attempt + 1}/{max_retries + 1}), retrying in {delay}s: {e}")
+                    if e.retry_after is not None:
+                        # The provider told us how long to wait
+                        delay = e.retry_after
+                    else:
+                        # Jitter the configured delay by +/-50% so concurrent
+                        # callers don't all retry at the same instant
+                        base_delay = retry_delays[min(attempt, len(retry_delays) - 1)]
+                        delay = random.uniform(base_delay * 0.5, base_delay * 1.5)
+                    # Never wait longer than configured, whatever the provider asked for
+                    delay = min(delay, self.config.llm.max_retry_delay)
+                    logger.warning(f"LLM call failed (attempt {attempt + 1}/{max_retries + 1}), retrying in {delay:.2f}s: {e}")
                     await asyncio.sleep(delay)
                     continue
                 else:
@@ -142,22 +268,71 @@ class LLMManager:
         # Should not reach here, but just in case
         raise LLMError(f"All {max_retries} retries failed. Last error: {last_error}")
 
-    def _get_cache_key(self, content: str, params: Dict[str, Any]) -> str:
+    async def _compute_cache_key(self, size: int, key_func: Any, *args: Any) -> Optional[bytes]:
+        """
+        Compute a cache key, hashing very large prompts off the event loop.
+
+        Args:
+            size: Total prompt length in characters
+            key_func: Cache key function to call
+            *args: Arguments for ``key_func``
+
+        Returns:
+            Cache key, or None when caching is disabled
+        """
+        if not self.enable_cache:
+            return None
+        if size > _OFFLOAD_HASH_CHARS:
+            return await asyncio.to_thread(key_func, *args)
+        return key_func(*args)
+
+    def _get_cache_key(self, content: str, params: Dict[str, Any]) -> bytes:
         """
         Generate cache key from content and parameters.
 
+        The key only needs to be collision-resistant, not cryptographically
+        secure, so a 16-byte BLAKE2b digest is used instead of a SHA-256 hex string.
+
         Args:
             content: Content to hash
             params: Additional parameters
 
         Returns:
-            Cache key (hash)
+            Cache key (raw digest bytes)
         """
-        # Create a stable string representation
-        cache_data = f"{content}:{json.dumps(params, sort_keys=True)}"
-        return hashlib.sha256(cache_data.encode()).hexdigest()
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(content.encode())
+        digest.update(b"\x00")
+        digest.update(_params_signature(params).encode())
+        return digest.digest()
 
-    def _get_from_cache(self, key: str) -> Optional[LLMResponse]:
+    def _get_messages_cache_key(self, messages: List[LLMMessage], params: Dict[str, Any]) -> bytes:
+        """
+        Generate cache key for a conversation.
+
+        Feeds each message's role and content to the hash in turn instead of
+        serializing the whole conversation with ``str(messages)``.
+
+        Args:
+            messages: Conversation messages
+            params: Additional parameters
+
+        Returns:
+            Cache key (raw digest bytes)
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for msg in messages:
+            digest.update(msg.role.encode())
+            digest.update(b"\x00")
+            if msg.content is SYSTEM_PROMPT:
+                digest.update(SYSTEM_PROMPT_BYTES)
+            else:
+                digest.update(msg.content.encode())
+            digest.update(b"\x01")
+        digest.update(_params_signature(params).encode())
+        return digest.digest()
+
+    def _get_from_cache(self, key: bytes) -> Optional[LLMResponse]:
         """
         Get response from cache if not expired.
 
@@ -167,20 +342,18 @@ class LLMManager:
         Returns:
             Cached response or None
         """
-        if key not in self._cache:
+        timestamp = self._cache_times.get(key)
+        if timestamp is None:
             return None
 
-        response, timestamp = self._cache[key]
-        ttl = self.config.llm.cache_ttl
-
-        if time.time() - timestamp > ttl:
-            # Cache expired
-            del self._cache[key]
+        if time.monotonic_ns() - timestamp > self.config.llm.cache_ttl * 1_000_000_000:
+            # Expired; the sweeper drops it
             return None
 
-        return response
+        self._cache.move_to_end(key)
+        return self._cache[key]
 
-    def _add_to_cache(self, key: str, response: LLMResponse) -> None:
+    def _add_to_cache(self, key: bytes, response: LLMResponse) -> None:
         """
         Add response to cache with LRU eviction.
 
@@ -189,18 +362,64 @@ class LLMManager:
             response: Response to cache
         """
         # Implement LRU eviction if cache is full
-        if len(self._cache) >= self.max_cache_size:
-            # Remove oldest entry
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self.max_cache_size:
+            # Remove least recently used entry
+            evicted, _ = self._cache.popitem(last=False)
+            del self._cache_times[evicted]
             logger.debug(f"Cache full, evicted oldest entry. Size: {len(self._cache)}")
 
-        self._cache[key] = (response, time.time())
+        self._cache[key] = response
+        self._cache_times[key] = time.monotonic_ns()
         logger.debug(f"Added to cache. Cache size: {len(self._cache)}/{self.max_cache_size}")
 
+    def _ensure_sweeper(self) -> None:
+        """Start the background TTL sweeper on the running loop if needed."""
+        if self._sweeper_task is None or self._sweeper_task.done():
+            self._sweeper_task = asyncio.create_task(self._sweep_expired(weakref.ref(self)))
+
+    @staticmethod
+    async def _sweep_expired(manager_ref: "weakref.ReferenceType[LLMManager]") -> None:
+        """
+        Periodically drop expired cache entries.
+
+        Only a weak reference is held between sweeps so the task does not keep
+        an otherwise unused manager alive.
+
+        Args:
+            manager_ref: Weak reference to the owning manager
+        """
+        while True:
+            manager = manager_ref()
+            if manager is None:
+                return
+            interval = max(manager.config.llm.cache_ttl / 4, 1.0)
+            del manager
+
+            await asyncio.sleep(interval)
+
+            manager = manager_ref()
+            if manager is None:
+                return
+            manager._evict_expired()
+            del manager
+
+    def _evict_expired(self) -> None:
+        """Remove all cache entries older than the configured TTL."""
+        now = time.monotonic_ns()
+        ttl_ns = self.config.llm.cache_ttl * 1_000_000_000
+        expired = [key for key, timestamp in self._cache_times.items() if now - timestamp > ttl_ns]
+        for key in expired:
+            del self._cache[key]
+            del self._cache_times[key]
+        if expired:
+            logger.debug(f"Swept {len(expired)} expired cache entries. Size: {len(self._cache)}")
+
     def clear_cache(self) -> None:
         """Clear the response cache."""
         self._cache.clear()
+        self._cache_times.clear()
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """
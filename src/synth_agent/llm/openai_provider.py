@@ -2,12 +2,47 @@
 OpenAI LLM provider implementation.
 """
 
-from typing import Any, List
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from openai import AsyncOpenAI, OpenAIError
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, OpenAIError
 
 from synth_agent.core.exceptions import LLMError, LLMProviderError, LLMTimeoutError
-from synth_agent.llm.base import BaseLLMProvider, LLMMessage, LLMResponse
+from synth_agent.llm.base import (
+    BaseLLMProvider,
+    LLMMessage,
+    LLMResponse,
+    drop_closed_loop_clients,
+    get_retry_after,
+    running_loop,
+)
+
+
+# Request parameters that fall back to the provider's configured defaults
+_DEFAULTED_PARAMS = frozenset(("model", "temperature", "max_tokens"))
+
+# Clients shared by every provider with the same credentials so the
+# connection pool (and its keep-alive connections) survives across instances.
+# Pools are bound to the event loop that opened them, so the loop is part of the key
+_CLIENT_CACHE: Dict[Tuple[str, int, Optional[asyncio.AbstractEventLoop]], AsyncOpenAI] = {}
+
+
+def _get_client(api_key: str, timeout: int) -> AsyncOpenAI:
+    """Get the shared AsyncOpenAI client for an API key, timeout and running loop."""
+    key = (api_key, timeout, running_loop())
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        drop_closed_loop_clients(_CLIENT_CACHE)
+        client = AsyncOpenAI(
+            api_key=api_key,
+            timeout=timeout,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            ),
+        )
+        _CLIENT_CACHE[key] = client
+    return client
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -34,7 +69,11 @@ class OpenAIProvider(BaseLLMProvider):
             **kwargs: Additional OpenAI parameters
         """
         super().__init__(api_key, model, temperature, max_tokens, timeout, **kwargs)
-        self.client = AsyncOpenAI(api_key=api_key, timeout=timeout)
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Shared AsyncOpenAI client for the running event loop."""
+        return _get_client(self.api_key, self.timeout)
 
     async def complete(self, prompt: str, **kwargs: Any) -> LLMResponse:
         """
@@ -62,13 +101,7 @@ class OpenAIProvider(BaseLLMProvider):
             LLMResponse with generated content
         """
         try:
-            # Merge kwargs with defaults
-            params = {
-                "model": kwargs.get("model", self.model),
-                "temperature": kwargs.get("temperature", self.temperature),
-                "max_tokens": kwargs.get("max_tokens", self.max_tokens),
-                **{k: v for k, v in kwargs.items() if k not in ["model", "temperature", "max_tokens"]},
-            }
+            params = self._build_params(kwargs)
 
             # Format messages
             formatted_messages = self.format_messages(messages)
@@ -99,28 +132,85 @@ class OpenAIProvider(BaseLLMProvider):
         except TimeoutError as e:
             raise LLMTimeoutError(f"OpenAI request timed out: {e}")
         except OpenAIError as e:
-            raise LLMProviderError(f"OpenAI API error: {e}")
+            raise LLMProviderError(f"OpenAI API error: {e}", retry_after=get_retry_after(e))
         except Exception as e:
             raise LLMError(f"Unexpected error in OpenAI provider: {e}")
 
+    async def stream(self, messages: List[LLMMessage], **kwargs: Any) -> AsyncIterator[str]:
+        """
+        Stream response text for a conversation as it is generated.
+
+        Args:
+            messages: List of conversation messages
+            **kwargs: Additional parameters
+
+        Yields:
+            Text chunks in generation order
+        """
+        try:
+            params = self._build_params(kwargs)
+            params["stream"] = True
+
+            response = await self.client.chat.completions.create(
+                messages=self.format_messages(messages), **params
+            )
+
+            async for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except TimeoutError as e:
+            raise LLMTimeoutError(f"OpenAI request timed out: {e}")
+        except OpenAIError as e:
+            raise LLMProviderError(f"OpenAI API error: {e}", retry_after=get_retry_after(e))
+        except Exception as e:
+            raise LLMError(f"Unexpected error in OpenAI provider: {e}")
+
+    def _build_params(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge per-call overrides with the provider defaults.
+
+        Args:
+            kwargs: Per-call parameters
+
+        Returns:
+            Keyword arguments for ``chat.completions.create``
+        """
+        params = {k: v for k, v in kwargs.items() if k not in _DEFAULTED_PARAMS}
+        params["model"] = kwargs.get("model", self.model)
+        params["temperature"] = kwargs.get("temperature", self.temperature)
+        params["max_tokens"] = kwargs.get("max_tokens", self.max_tokens)
+        return params
+
     def validate_api_key(self) -> bool:
         """
         Validate the API key.
 
+        Lists models with a synchronous request, so no event loop is started
+        and no tokens are consumed.
+
         Returns:
             True if valid, False otherwise
         """
         try:
-            # Simple validation by making a minimal request
-            import asyncio
+            response = httpx.get(
+                str(self.client.base_url.join("models")),
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=self.timeout,
+            )
+            return response.status_code == 200
+        except Exception:
+            return False
 
-            async def _validate() -> bool:
-                try:
-                    await self.client.models.list()
-                    return True
-                except Exception:
-                    return False
+    async def validate_api_key_async(self) -> bool:
+        """
+        Validate the API key on the shared async client.
 
-            return asyncio.run(_validate())
+        Returns:
+            True if valid, False otherwise
+        """
+        try:
+            await self.client.models.list()
+            return True
         except Exception:
             return False
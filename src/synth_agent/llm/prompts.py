@@ -2,6 +2,10 @@
 Prompt templates for LLM interactions.
 """
 
+from functools import lru_cache
+from string import Formatter
+from typing import Optional, Tuple
+
 # System prompts
 SYSTEM_PROMPT = """You are an expert synthetic data generation assistant. Your role is to:
 1. Understand user requirements for synthetic data generation
@@ -12,6 +16,9 @@ SYSTEM_PROMPT = """You are an expert synthetic data generation assistant. Your r
 
 You should be thorough, precise, and user-friendly in your interactions."""
 
+# Encoded once; the system prompt is hashed into the cache key of every chat request
+SYSTEM_PROMPT_BYTES = SYSTEM_PROMPT.encode("utf-8")
+
 # Requirement extraction prompts
 REQUIREMENT_EXTRACTION_PROMPT = """Analyze the following user request for synthetic data generation and extract structured requirements.
 
@@ -209,10 +216,33 @@ Return validation results as JSON:
 }}"""
 
 
+@lru_cache(maxsize=32)
+def _compile_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """
+    Split a template into (literal text, field name) pieces once.
+
+    Args:
+        template: Prompt template string
+
+    Returns:
+        Template pieces, or None if the template uses positional fields,
+        conversions or format specs and needs ``str.format``
+    """
+    pieces = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        pieces.append((literal, field))
+    return tuple(pieces)
+
+
 def format_prompt(template: str, **kwargs: str) -> str:
     """
     Format a prompt template with variables.
 
+    Templates are parsed on first use and cached, so repeated formatting only
+    substitutes values instead of rescanning the (escaped) brace syntax.
+
     Args:
         template: Prompt template string
         **kwargs: Variables to substitute
@@ -220,4 +250,13 @@ def format_prompt(template: str, **kwargs: str) -> str:
     Returns:
         Formatted prompt
     """
-    return template.format(**kwargs)
+    pieces = _compile_template(template)
+    if pieces is None:
+        return template.format(**kwargs)
+
+    parts = []
+    for literal, field in pieces:
+        parts.append(literal)
+        if field is not None:
+            parts.append(format(kwargs[field]))
+    return "".join(parts)
@@ -5,22 +5,62 @@ Ideal for optimization problems, scheduling data, and resource allocation
 scenarios requiring optimal path finding with heuristics.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Callable, Collection, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
-import copy
 import heapq
+import re
 
-from .base import BaseReasoningStrategy, ReasoningResult
+from .base import BaseReasoningStrategy, ReasoningResult, fast_deepcopy
+
+
+# Constraint added by the optimization action; one shared object, so
+# membership tests on constraint lists usually succeed on identity
+_OPTIMIZATION_CONSTRAINT = "Optimize for efficiency"
+
+# Keywords the heuristic looks for (as substrings of lower-cased text)
+_OPTIMIZATION_CONSTRAINT_RE = re.compile("optim|schedule")
+_RESOURCE_FIELD_RE = re.compile("resource|allocation|capacity|schedule")
+
+
+def _add_optimization_constraint(requirements: Dict[str, Any]) -> None:
+    """Action: add an optimization constraint."""
+    requirements["constraints"] = [*requirements.get("constraints", []), _OPTIMIZATION_CONSTRAINT]
+
+
+def _set_optimization_level(requirements: Dict[str, Any]) -> None:
+    """Action: require a high optimization level."""
+    requirements["quality_requirements"] = {
+        **requirements.get("quality_requirements", {}),
+        "optimization_level": "high",
+    }
+
+
+# Fixed action set: (apply function, cost, index of the state flag it sets)
+_ACTIONS = (
+    # Action 1: Add optimization constraints
+    (_add_optimization_constraint, 0.1, 0),
+    # Action 2: Add resource fields
+    (_set_optimization_level, 0.2, 2),
+)
 
 
 @dataclass(order=True)
 class AStarNode:
-    """Node for A* search."""
+    """
+    Node for A* search.
+
+    Nodes keep the action that produced them and a link to their parent
+    instead of a copy of the requirements; the requirements for the chosen
+    node are rebuilt once by replaying its path.
+    """
     f_score: float  # f(n) = g(n) + h(n)
     g_score: float = field(compare=False)  # Cost from start
     h_score: float = field(compare=False)  # Heuristic to goal
-    requirements: Dict[str, Any] = field(compare=False)
     depth: int = field(default=0, compare=False)
+    # (has optimization constraint, has resource field, has optimization level)
+    state: Tuple[bool, bool, bool] = field(default=(False, False, False), compare=False)
+    parent: Optional["AStarNode"] = field(default=None, compare=False)
+    action: Optional[Callable[[Dict[str, Any]], None]] = field(default=None, compare=False)
 
 
 class AStarReasoner(BaseReasoningStrategy):
@@ -36,6 +76,8 @@ class AStarReasoner(BaseReasoningStrategy):
         super().__init__(config)
 
         self.max_nodes = 30
+        # Heuristic values by state signature; only 8 signatures exist
+        self._h_cache: Dict[Tuple[bool, bool, bool], float] = {}
 
     async def reason(
         self,
@@ -61,18 +103,25 @@ class AStarReasoner(BaseReasoningStrategy):
 
         # Initialize
         g_score = 0.0
-        h_score = self._heuristic(requirements)
+        state = self._state_key(requirements)
+        h_score = self._heuristic_for_state(state)
         f_score = g_score + h_score
 
         start_node = AStarNode(
             f_score=f_score,
             g_score=g_score,
             h_score=h_score,
-            requirements=copy.deepcopy(requirements),
             depth=0,
+            state=state,
         )
 
-        open_set = [start_node]
+        # Entries are (f_score, push order, node) so heapq compares floats and
+        # ints in C instead of calling AStarNode's generated __lt__
+        open_set = [(start_node.f_score, 0, start_node)]
+        push_count = 1
+        # Duplicate detection is on state content: the cheapest known cost per
+        # open state, and the states already expanded
+        best_g = {start_node.state: start_node.g_score}
         closed_set = set()
 
         best_node = start_node
@@ -80,15 +129,20 @@ class AStarReasoner(BaseReasoningStrategy):
 
         while open_set and nodes_explored < self.max_nodes:
             # Pop node with lowest f_score
-            current = heapq.heappop(open_set)
+            _, _, current = heapq.heappop(open_set)
+            if current.state in closed_set:
+                # Superseded by a cheaper path to the same state
+                continue
             nodes_explored += 1
 
-            reasoning_steps.append(
-                f"Node {nodes_explored}: f={current.f_score:.3f} (g={current.g_score:.3f}, h={current.h_score:.3f})"
-            )
+            if self.log_steps:
+                reasoning_steps.append(
+                    f"Node {nodes_explored}: f={current.f_score:.3f} "
+                    f"(g={current.g_score:.3f}, h={current.h_score:.3f})"
+                )
 
             # Check if goal reached
-            if self._is_goal(current.requirements):
+            if current.h_score <= 0.1:
                 best_node = current
                 reasoning_steps.append("  ✓ Goal state reached!")
                 break
@@ -98,14 +152,17 @@ class AStarReasoner(BaseReasoningStrategy):
                 best_node = current
 
             # Add to closed set
-            closed_set.add(id(current))
+            closed_set.add(current.state)
 
             # Generate successors
-            successors = self._generate_successors(current)
+            successors = self._generate_successors(current, closed_set)
 
             for successor in successors:
-                if id(successor) not in closed_set:
-                    heapq.heappush(open_set, successor)
+                if successor.g_score >= best_g.get(successor.state, float("inf")):
+                    continue
+                best_g[successor.state] = successor.g_score
+                heapq.heappush(open_set, (successor.f_score, push_count, successor))
+                push_count += 1
 
         reasoning_steps.extend([
             f"Explored {nodes_explored} nodes",
@@ -122,7 +179,7 @@ class AStarReasoner(BaseReasoningStrategy):
         )
 
         return ReasoningResult(
-            enhanced_requirements=best_node.requirements,
+            enhanced_requirements=self._materialize(best_node, requirements),
             reasoning_steps=reasoning_steps,
             confidence=confidence,
             metadata={
@@ -139,76 +196,122 @@ class AStarReasoner(BaseReasoningStrategy):
 
         Lower values = closer to goal.
         """
-        distance = 1.0  # Start far from goal
+        return self._heuristic_for_state(self._state_key(requirements))
 
+    def _state_key(self, requirements: Dict[str, Any]) -> Tuple[bool, bool, bool]:
+        """
+        Reduce requirements to the features the heuristic reads.
+
+        Returns:
+            (has optimization constraint, has resource field, has optimization level)
+        """
         # Goal: Have optimization-related specifications
-        if "constraints" in requirements:
-            constraints = requirements["constraints"]
-            if any(
-                isinstance(c, str) and ("optim" in c.lower() or "schedule" in c.lower())
-                for c in constraints
-            ):
-                distance -= 0.3
+        has_opt_constraint = "constraints" in requirements and (
+            _OPTIMIZATION_CONSTRAINT in requirements["constraints"]
+            or any(
+                isinstance(c, str) and _OPTIMIZATION_CONSTRAINT_RE.search(c.lower()) is not None
+                for c in requirements["constraints"]
+            )
+        )
 
         # Goal: Have resource allocation fields
-        if "fields" in requirements:
-            for field in requirements.get("fields", []):
-                if isinstance(field, dict):
-                    name = field.get("name", "").lower()
-                    if any(kw in name for kw in ["resource", "allocation", "capacity", "schedule"]):
-                        distance -= 0.2
-                        break
+        has_resource_field = "fields" in requirements and any(
+            isinstance(field, dict)
+            and _RESOURCE_FIELD_RE.search(field.get("name", "").lower()) is not None
+            for field in requirements.get("fields", [])
+        )
 
         # Goal: Have optimization quality requirements
-        if "quality_requirements" in requirements:
-            quality = requirements["quality_requirements"]
-            if "optimization_level" in quality:
-                distance -= 0.3
+        has_opt_level = (
+            "quality_requirements" in requirements
+            and "optimization_level" in requirements["quality_requirements"]
+        )
+
+        return (has_opt_constraint, has_resource_field, has_opt_level)
 
-        return max(0.0, distance)
+    def _heuristic_for_state(self, state: Tuple[bool, bool, bool]) -> float:
+        """Heuristic value for a state signature, memoized per reasoner."""
+        h_score = self._h_cache.get(state)
+        if h_score is None:
+            has_opt_constraint, has_resource_field, has_opt_level = state
+            distance = 1.0  # Start far from goal
+            if has_opt_constraint:
+                distance -= 0.3
+            if has_resource_field:
+                distance -= 0.2
+            if has_opt_level:
+                distance -= 0.3
+            h_score = self._h_cache[state] = max(0.0, distance)
+        return h_score
 
     def _is_goal(self, requirements: Dict[str, Any]) -> bool:
         """Check if requirements represent goal state."""
         return self._heuristic(requirements) <= 0.1
 
-    def _generate_successors(self, node: AStarNode) -> List[AStarNode]:
-        """Generate successor nodes with costs."""
+    def _generate_successors(
+        self,
+        node: AStarNode,
+        skip_states: Collection[Tuple[bool, bool, bool]] = (),
+    ) -> List[AStarNode]:
+        """
+        Generate successor nodes with costs.
+
+        Each action's resulting state is known from the parent's state, so
+        actions that would not change the state (or reach a state in
+        ``skip_states``) are dropped.
+
+        Args:
+            node: Node to expand
+            skip_states: States that need no further successors (e.g. expanded ones)
+
+        Returns:
+            New successor nodes
+        """
         successors = []
 
-        # Action 1: Add optimization constraints (cost: 0.1)
-        variant1 = copy.deepcopy(node.requirements)
-        if "constraints" not in variant1:
-            variant1["constraints"] = []
-        variant1["constraints"].append("Optimize for efficiency")
-
-        g1 = node.g_score + 0.1
-        h1 = self._heuristic(variant1)
-        successors.append(AStarNode(
-            f_score=g1 + h1,
-            g_score=g1,
-            h_score=h1,
-            requirements=variant1,
-            depth=node.depth + 1,
-        ))
-
-        # Action 2: Add resource fields (cost: 0.2)
-        variant2 = copy.deepcopy(node.requirements)
-        if "quality_requirements" not in variant2:
-            variant2["quality_requirements"] = {}
-        variant2["quality_requirements"]["optimization_level"] = "high"
-
-        g2 = node.g_score + 0.2
-        h2 = self._heuristic(variant2)
-        successors.append(AStarNode(
-            f_score=g2 + h2,
-            g_score=g2,
-            h_score=h2,
-            requirements=variant2,
-            depth=node.depth + 1,
-        ))
+        for action, cost, flag in _ACTIONS:
+            if node.state[flag]:
+                continue
+            state = node.state[:flag] + (True,) + node.state[flag + 1:]
+            if state in skip_states:
+                continue
+
+            g_score = node.g_score + cost
+            h_score = self._heuristic_for_state(state)
+            successors.append(AStarNode(
+                f_score=g_score + h_score,
+                g_score=g_score,
+                h_score=h_score,
+                depth=node.depth + 1,
+                state=state,
+                parent=node,
+                action=action,
+            ))
 
         return successors
 
+    @staticmethod
+    def _materialize(node: AStarNode, requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the requirements for a node by replaying its path.
+
+        Args:
+            node: Search node
+            requirements: Requirements at the start node
+
+        Returns:
+            Requirements with the node's actions applied, in path order
+        """
+        actions = []
+        while node.action is not None:
+            actions.append(node.action)
+            node = node.parent
+
+        result = fast_deepcopy(requirements)
+        for action in reversed(actions):
+            action(result)
+        return result
+
     def get_metadata(self) -> Dict[str, Any]:
         """Get metadata about A* Search reasoning."""
         return {
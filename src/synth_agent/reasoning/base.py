@@ -4,8 +4,12 @@ Base reasoning strategy interface for synthetic data generation.
 All reasoning methods implement this interface to ensure consistent behavior.
 """
 
+import copy
+import pickle
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
@@ -14,6 +18,59 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Domain keywords found in data_type; earlier domains in _DOMAIN_PRIORITY win
+_DOMAIN_KEYWORDS = {
+    "financial": "financial",
+    "transaction": "financial",
+    "payment": "financial",
+    "trading": "financial",
+    "patient": "healthcare",
+    "medical": "healthcare",
+    "healthcare": "healthcare",
+    "diagnosis": "healthcare",
+    "product": "ecommerce",
+    "order": "ecommerce",
+    "ecommerce": "ecommerce",
+    "retail": "ecommerce",
+    "network": "network",
+    "graph": "network",
+    "social": "network",
+    "connection": "network",
+}
+_DOMAIN_PRIORITY = ("financial", "healthcare", "ecommerce", "network")
+# Lookahead so overlapping keywords are all found, matching plain substring checks
+_DOMAIN_KEYWORD_RE = re.compile(f"(?=({'|'.join(_DOMAIN_KEYWORDS)}))")
+
+
+def fast_deepcopy(obj: Any) -> Any:
+    """
+    Deep-copy a requirements tree.
+
+    JSON-like trees of dicts, lists and primitives round-trip through pickle
+    several times faster than ``copy.deepcopy``; anything pickle cannot handle
+    falls back to ``copy.deepcopy``.
+
+    Args:
+        obj: Object to copy
+
+    Returns:
+        Independent copy of ``obj``
+    """
+    try:
+        return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return copy.deepcopy(obj)
+
+
+@lru_cache(maxsize=256)
+def _domain_for_data_type(data_type: str) -> Optional[str]:
+    """Map a lower-cased data_type to its domain with one regex scan."""
+    matched = {_DOMAIN_KEYWORDS[kw] for kw in _DOMAIN_KEYWORD_RE.findall(data_type)}
+    for domain in _DOMAIN_PRIORITY:
+        if domain in matched:
+            return domain
+    return None
+
 
 @dataclass
 class ReasoningResult:
@@ -66,6 +123,10 @@ class BaseReasoningStrategy(ABC):
         """
         self.config = config
         self.logger = structlog.get_logger(self.__class__.__name__)
+        # Per-iteration reasoning steps are formatted only when enabled
+        self.log_steps = getattr(
+            getattr(config, "reasoning", None), "log_reasoning_steps", True
+        )
 
     @abstractmethod
     async def reason(
@@ -150,22 +211,6 @@ class BaseReasoningStrategy(ABC):
 
         # Check data_type field
         if "data_type" in requirements:
-            data_type = requirements["data_type"].lower()
-
-            # Financial keywords
-            if any(kw in data_type for kw in ["financial", "transaction", "payment", "trading"]):
-                return "financial"
-
-            # Healthcare keywords
-            if any(kw in data_type for kw in ["patient", "medical", "healthcare", "diagnosis"]):
-                return "healthcare"
-
-            # E-commerce keywords
-            if any(kw in data_type for kw in ["product", "order", "ecommerce", "retail"]):
-                return "ecommerce"
-
-            # Network keywords
-            if any(kw in data_type for kw in ["network", "graph", "social", "connection"]):
-                return "network"
+            return _domain_for_data_type(requirements["data_type"].lower())
 
         return None
@@ -7,9 +7,26 @@ but high-quality output candidates.
 
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
-import copy
+from types import MappingProxyType
+import heapq
 
-from .base import BaseReasoningStrategy, ReasoningResult
+from .base import BaseReasoningStrategy, ReasoningResult, fast_deepcopy
+
+
+# Fixed settings applied by the quality and variation enhancements. Variants
+# share these read-only views; the chosen result gets its own dict copies.
+_HIGH_QUALITY = MappingProxyType({
+    "null_percentage": 0.0,
+    "duplicate_percentage": 0.0,
+    "quality_level": "high",
+})
+_BALANCED_QUALITY = MappingProxyType({
+    "null_percentage": 0.05,
+    "duplicate_percentage": 0.02,
+    "quality_level": "medium",
+})
+_HIGH_VARIATION = MappingProxyType({"diversity": "high"})
+_LOW_VARIATION = MappingProxyType({"diversity": "low", "realistic": True})
 
 
 @dataclass
@@ -17,6 +34,10 @@ class Candidate:
     """Candidate requirement configuration."""
     requirements: Dict[str, Any]
     score: float = 0.0
+    # Number of fields with a description / examples, kept up to date as
+    # variants are derived so scoring need not rescan the fields
+    description_count: int = 0
+    examples_count: int = 0
 
 
 class BeamSearchReasoner(BaseReasoningStrategy):
@@ -66,11 +87,13 @@ class BeamSearchReasoner(BaseReasoningStrategy):
         ]
 
         # Initialize beam with original requirements
-        beam = [Candidate(requirements=copy.deepcopy(requirements), score=0.0)]
+        initial = fast_deepcopy(requirements)
+        beam = [Candidate(requirements=initial, score=0.0, **self._count_field_keys(initial))]
 
         # Iteratively expand and prune
         for depth in range(self.max_depth):
-            reasoning_steps.append(f"Depth {depth + 1}: Expanding candidates")
+            if self.log_steps:
+                reasoning_steps.append(f"Depth {depth + 1}: Expanding candidates")
 
             # Generate successors for each candidate
             all_successors = []
@@ -78,24 +101,25 @@ class BeamSearchReasoner(BaseReasoningStrategy):
                 successors = self._generate_successors(candidate, depth)
                 all_successors.extend(successors)
 
-            reasoning_steps.append(
-                f"Generated {len(all_successors)} candidate variations"
-            )
+            if self.log_steps:
+                reasoning_steps.append(
+                    f"Generated {len(all_successors)} candidate variations"
+                )
 
             # Score all successors
             for successor in all_successors:
                 successor.score = self._score_candidate(successor)
 
             # Keep top-k candidates
-            all_successors.sort(key=lambda c: c.score, reverse=True)
-            beam = all_successors[:self.beam_width]
+            beam = heapq.nlargest(self.beam_width, all_successors, key=lambda c: c.score)
 
-            reasoning_steps.append(
-                f"Retained top {len(beam)} candidates (scores: {[f'{c.score:.3f}' for c in beam[:3]]})"
-            )
+            if self.log_steps:
+                reasoning_steps.append(
+                    f"Retained top {len(beam)} candidates (scores: {[f'{c.score:.3f}' for c in beam[:3]]})"
+                )
 
-        # Select best candidate
-        best = max(beam, key=lambda c: c.score)
+        # Select best candidate (nlargest leaves the beam sorted best-first)
+        best = beam[0]
 
         reasoning_steps.extend([
             f"Explored {self.beam_width * self.max_depth} configurations",
@@ -111,7 +135,10 @@ class BeamSearchReasoner(BaseReasoningStrategy):
         )
 
         return ReasoningResult(
-            enhanced_requirements=best.requirements,
+            enhanced_requirements={
+                key: dict(value) if isinstance(value, MappingProxyType) else value
+                for key, value in best.requirements.items()
+            },
             reasoning_steps=reasoning_steps,
             confidence=confidence,
             metadata={
@@ -147,23 +174,46 @@ class BeamSearchReasoner(BaseReasoningStrategy):
         """Enhance field specifications."""
         variants = []
 
+        # Variants share unchanged values with the candidate; only fields
+        # that gain a key are copied
         base_req = candidate.requirements
 
+        # Without fields both variants would equal the candidate; carry it
+        # forward once instead of scoring two identical copies
+        if not isinstance(base_req.get("fields"), list) or not base_req["fields"]:
+            return [candidate]
+
         # Variant 1: Add detailed descriptions
-        variant1 = copy.deepcopy(base_req)
-        if "fields" in variant1:
-            for field in variant1.get("fields", []):
-                if isinstance(field, dict) and "description" not in field:
-                    field["description"] = f"Enhanced description for {field.get('name', 'field')}"
-        variants.append(Candidate(requirements=variant1))
+        variant1 = dict(base_req)
+        added = 0
+        fields = []
+        for field in base_req["fields"]:
+            if isinstance(field, dict) and "description" not in field:
+                field = {**field, "description": f"Enhanced description for {field.get('name', 'field')}"}
+                added += 1
+            fields.append(field)
+        variant1["fields"] = fields
+        variants.append(Candidate(
+            requirements=variant1,
+            description_count=candidate.description_count + added,
+            examples_count=candidate.examples_count,
+        ))
 
         # Variant 2: Add example values
-        variant2 = copy.deepcopy(base_req)
-        if "fields" in variant2:
-            for field in variant2.get("fields", []):
-                if isinstance(field, dict) and "examples" not in field:
-                    field["examples"] = []
-        variants.append(Candidate(requirements=variant2))
+        variant2 = dict(base_req)
+        added = 0
+        fields = []
+        for field in base_req["fields"]:
+            if isinstance(field, dict) and "examples" not in field:
+                field = {**field, "examples": []}
+                added += 1
+            fields.append(field)
+        variant2["fields"] = fields
+        variants.append(Candidate(
+            requirements=variant2,
+            description_count=candidate.description_count,
+            examples_count=candidate.examples_count + added,
+        ))
 
         return variants
 
@@ -174,22 +224,12 @@ class BeamSearchReasoner(BaseReasoningStrategy):
         base_req = candidate.requirements
 
         # Variant 1: High quality, low diversity
-        variant1 = copy.deepcopy(base_req)
-        variant1["quality_requirements"] = {
-            "null_percentage": 0.0,
-            "duplicate_percentage": 0.0,
-            "quality_level": "high",
-        }
-        variants.append(Candidate(requirements=variant1))
+        variant1 = {**base_req, "quality_requirements": _HIGH_QUALITY}
+        variants.append(self._derive(candidate, variant1))
 
         # Variant 2: Balanced quality and diversity
-        variant2 = copy.deepcopy(base_req)
-        variant2["quality_requirements"] = {
-            "null_percentage": 0.05,
-            "duplicate_percentage": 0.02,
-            "quality_level": "medium",
-        }
-        variants.append(Candidate(requirements=variant2))
+        variant2 = {**base_req, "quality_requirements": _BALANCED_QUALITY}
+        variants.append(self._derive(candidate, variant2))
 
         return variants
 
@@ -200,17 +240,38 @@ class BeamSearchReasoner(BaseReasoningStrategy):
         base_req = candidate.requirements
 
         # Variant 1: High variation
-        variant1 = copy.deepcopy(base_req)
-        variant1["variation_params"] = {"diversity": "high"}
-        variants.append(Candidate(requirements=variant1))
+        variant1 = {**base_req, "variation_params": _HIGH_VARIATION}
+        variants.append(self._derive(candidate, variant1))
 
         # Variant 2: Low variation (more realistic)
-        variant2 = copy.deepcopy(base_req)
-        variant2["variation_params"] = {"diversity": "low", "realistic": True}
-        variants.append(Candidate(requirements=variant2))
+        variant2 = {**base_req, "variation_params": _LOW_VARIATION}
+        variants.append(self._derive(candidate, variant2))
 
         return variants
 
+    @staticmethod
+    def _derive(candidate: Candidate, requirements: Dict[str, Any]) -> Candidate:
+        """Create a variant whose fields are unchanged from ``candidate``."""
+        return Candidate(
+            requirements=requirements,
+            description_count=candidate.description_count,
+            examples_count=candidate.examples_count,
+        )
+
+    @staticmethod
+    def _count_field_keys(requirements: Dict[str, Any]) -> Dict[str, int]:
+        """Count fields with a description and with examples."""
+        description_count = examples_count = 0
+        fields = requirements.get("fields")
+        if isinstance(fields, list):
+            for field in fields:
+                if isinstance(field, dict):
+                    if "description" in field:
+                        description_count += 1
+                    if "examples" in field:
+                        examples_count += 1
+        return {"description_count": description_count, "examples_count": examples_count}
+
     def _score_candidate(self, candidate: Candidate) -> float:
         """Score a candidate based on completeness and quality."""
         requirements = candidate.requirements
@@ -219,14 +280,7 @@ class BeamSearchReasoner(BaseReasoningStrategy):
         # Completeness scoring
         if "fields" in requirements:
             score += 0.3
-            fields = requirements["fields"]
-            if isinstance(fields, list):
-                for field in fields:
-                    if isinstance(field, dict):
-                        if "description" in field:
-                            score += 0.05
-                        if "examples" in field:
-                            score += 0.03
+            score += 0.05 * candidate.description_count + 0.03 * candidate.examples_count
 
         # Quality specifications
         if "quality_requirements" in requirements:
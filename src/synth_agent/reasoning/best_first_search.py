@@ -5,15 +5,83 @@ Ideal for time-series data, sequential patterns, and scenarios where
 prioritizing the most promising paths leads to better results.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
-import copy
+from types import MappingProxyType
+import asyncio
 import heapq
+import re
 
-from .base import BaseReasoningStrategy, ReasoningResult
+from .base import BaseReasoningStrategy, ReasoningResult, fast_deepcopy
 
 
-@dataclass(order=True)
+# Keywords the heuristic looks for (as substrings of lower-cased text)
+_TEMPORAL_NAME_RE = re.compile("time|date")  # "timestamp" contains "time"
+_TEMPORAL_TYPE_RE = re.compile("datetime|timestamp")
+_SEQUENTIAL_CONSTRAINT_RE = re.compile("sequential|order", re.IGNORECASE)
+
+# Nodes explored between yields to the event loop
+_YIELD_INTERVAL = 8
+
+
+def _evaluation_score(signature: int) -> float:
+    """
+    Score requirements from their evaluation signature.
+
+    Args:
+        signature: Bit flags - 1: has fields, 2: has constraints,
+            4: has quality requirements, 8: has temporal fields
+
+    Returns:
+        Score in [0, 1]
+    """
+    score = 0.3  # Base score
+
+    # Completeness
+    if signature & 1:
+        score += 0.2
+
+    if signature & 2:
+        score += 0.15
+
+    if signature & 4:
+        score += 0.15
+
+    # Time-series specific
+    if signature & 8:
+        score += 0.2
+
+    return score if score < 1.0 else 1.0
+
+
+# Scores for all 16 signatures, so evaluation is a table lookup
+_EVALUATION_SCORES = tuple(_evaluation_score(signature) for signature in range(16))
+
+
+def _add_temporal_ordering(constraints: Any) -> Tuple[List[Any], float]:
+    """Enhancement: add a temporal ordering constraint."""
+    # "Maintain temporal ordering" matches the ordering keyword once
+    return [*constraints, "Maintain temporal ordering"], 0.2
+
+
+def _add_temporal_consistency(quality: Any) -> Tuple[Dict[str, Any], float]:
+    """Enhancement: require temporal consistency."""
+    # Scores only if temporal consistency was not already required
+    delta = 0.0 if "temporal_consistency" in quality else 0.2
+    return {**quality, "temporal_consistency": True}, delta
+
+
+# Fixed enhancement set: (requirements key, value when the key is missing,
+# function returning the key's new value and the resulting heuristic change)
+_ENHANCEMENTS = (
+    # Enhancement 1: Add temporal constraints
+    ("constraints", (), _add_temporal_ordering),
+    # Enhancement 2: Add time-series quality
+    ("quality_requirements", MappingProxyType({}), _add_temporal_consistency),
+)
+
+
+@dataclass(order=True, slots=True)
 class PrioritizedNode:
     """Node with priority for best-first search."""
     priority: float
@@ -60,46 +128,74 @@ class BestFirstSearchReasoner(BaseReasoningStrategy):
 
         # Priority queue (min-heap, so we negate priorities)
         initial_priority = -self._heuristic(requirements)
-        queue = [PrioritizedNode(
+        # Entries are (priority, push order, node) so heapq compares floats and
+        # ints in C instead of calling PrioritizedNode's generated __lt__
+        queue = [(initial_priority, 0, PrioritizedNode(
             priority=initial_priority,
-            requirements=copy.deepcopy(requirements),
+            requirements=fast_deepcopy(requirements),
             depth=0,
-        )]
+        ))]
+        push_count = 1
 
         best_node = None
         best_score = float('-inf')
         nodes_explored = 0
+        # (node number, priority, depth, new best score or None); formatted
+        # into reasoning steps once the search is done
+        trace = []
 
         while queue and nodes_explored < self.max_nodes:
+            # The search is CPU-bound; let other tasks run now and then
+            if nodes_explored and nodes_explored % _YIELD_INTERVAL == 0:
+                await asyncio.sleep(0)
+
             # Pop most promising node
-            current = heapq.heappop(queue)
+            _, _, current = heapq.heappop(queue)
             nodes_explored += 1
 
-            reasoning_steps.append(
-                f"Exploring node {nodes_explored} (priority: {-current.priority:.3f}, depth: {current.depth})"
-            )
-
             # Evaluate current node
             score = self._evaluate(current.requirements)
 
+            new_best = None
             if score > best_score:
                 best_score = score
                 best_node = current
-                reasoning_steps.append(f"  → New best score: {score:.3f}")
+                new_best = score
+
+            if self.log_steps:
+                trace.append((nodes_explored, current.priority, current.depth, new_best))
 
             # Expand if not at max depth
             if current.depth < self.max_depth:
                 successors = self._generate_successors(current)
 
                 for successor in successors:
-                    heapq.heappush(queue, successor)
+                    heapq.heappush(queue, (successor.priority, push_count, successor))
+                    push_count += 1
+
+                # Only the best (max_nodes - nodes_explored) entries can still
+                # be popped, so the queue is trimmed to those whenever it
+                # grows to twice that size (a sorted list is a valid heap).
+                # Trimming at 2x rather than on every overflow keeps the cost
+                # amortized O(log n) per push.
+                remaining = self.max_nodes - nodes_explored
+                if len(queue) > 2 * remaining:
+                    queue = heapq.nsmallest(remaining, queue)
+
+        for number, priority, depth, new_best in trace:
+            reasoning_steps.append(
+                f"Exploring node {number} (priority: {-priority:.3f}, depth: {depth})"
+            )
+            if new_best is not None:
+                reasoning_steps.append(f"  → New best score: {new_best:.3f}")
 
         reasoning_steps.extend([
             f"Explored {nodes_explored} nodes",
             f"Best configuration score: {best_score:.3f}",
         ])
 
-        confidence = min(1.0, best_score)
+        # _evaluate already caps scores at 1.0
+        confidence = best_score
 
         self.logger.info(
             "Best-First Search completed",
@@ -127,24 +223,21 @@ class BestFirstSearchReasoner(BaseReasoningStrategy):
         score = 0.0
 
         # Favor specifications with temporal fields
-        if "fields" in requirements:
-            for field in requirements.get("fields", []):
+        fields = requirements.get("fields")
+        if fields:
+            for field in fields:
                 if isinstance(field, dict):
-                    field_name = field.get("name", "").lower()
-                    field_type = field.get("type", "").lower()
-
-                    if any(kw in field_name for kw in ["time", "date", "timestamp"]):
+                    if _TEMPORAL_NAME_RE.search(field.get("name", "").lower()):
                         score += 0.3
 
-                    if "datetime" in field_type or "timestamp" in field_type:
+                    if _TEMPORAL_TYPE_RE.search(field.get("type", "").lower()):
                         score += 0.2
 
         # Favor sequential constraints
         if "constraints" in requirements:
-            for constraint in requirements.get("constraints", []):
-                if isinstance(constraint, str):
-                    if "sequential" in constraint.lower() or "order" in constraint.lower():
-                        score += 0.2
+            for constraint in requirements["constraints"]:
+                if isinstance(constraint, str) and _SEQUENTIAL_CONSTRAINT_RE.search(constraint):
+                    score += 0.2
 
         # Favor time-series quality requirements
         if "quality_requirements" in requirements:
@@ -156,66 +249,43 @@ class BestFirstSearchReasoner(BaseReasoningStrategy):
 
     def _evaluate(self, requirements: Dict[str, Any]) -> float:
         """Evaluate quality of requirements."""
-        score = 0.3  # Base score
-
-        # Completeness
-        if "fields" in requirements:
-            score += 0.2
-
-        if "constraints" in requirements:
-            score += 0.15
-
-        if "quality_requirements" in requirements:
-            score += 0.15
-
-        # Time-series specific
-        if self._has_temporal_fields(requirements):
-            score += 0.2
-
-        return min(1.0, score)
+        signature = (
+            ("fields" in requirements)
+            | ("constraints" in requirements) << 1
+            | ("quality_requirements" in requirements) << 2
+            | self._has_temporal_fields(requirements) << 3
+        )
+        return _EVALUATION_SCORES[signature]
 
     def _has_temporal_fields(self, requirements: Dict[str, Any]) -> bool:
         """Check if requirements have temporal fields."""
-        if "fields" not in requirements:
+        fields = requirements.get("fields")
+        if not fields:
             return False
 
-        for field in requirements.get("fields", []):
-            if isinstance(field, dict):
-                field_name = field.get("name", "").lower()
-                if any(kw in field_name for kw in ["time", "date", "timestamp"]):
-                    return True
-
-        return False
+        return any(
+            isinstance(field, dict) and _TEMPORAL_NAME_RE.search(field.get("name", "").lower())
+            for field in fields
+        )
 
     def _generate_successors(self, node: PrioritizedNode) -> List[PrioritizedNode]:
         """Generate successor nodes."""
         successors = []
-
-        # Enhancement 1: Add temporal constraints
-        variant1 = copy.deepcopy(node.requirements)
-        if "constraints" not in variant1:
-            variant1["constraints"] = []
-        variant1["constraints"].append("Maintain temporal ordering")
-
-        priority1 = -self._heuristic(variant1)
-        successors.append(PrioritizedNode(
-            priority=priority1,
-            requirements=variant1,
-            depth=node.depth + 1,
-        ))
-
-        # Enhancement 2: Add time-series quality
-        variant2 = copy.deepcopy(node.requirements)
-        if "quality_requirements" not in variant2:
-            variant2["quality_requirements"] = {}
-        variant2["quality_requirements"]["temporal_consistency"] = True
-
-        priority2 = -self._heuristic(variant2)
-        successors.append(PrioritizedNode(
-            priority=priority2,
-            requirements=variant2,
-            depth=node.depth + 1,
-        ))
+        requirements = node.requirements
+        parent_h = -node.priority
+        depth = node.depth + 1
+
+        # Successors share unchanged values with the parent and copy only
+        # the value they modify. Each enhancement reports how it changes the
+        # heuristic, so priorities are derived from the parent's instead of
+        # rescanning the requirements.
+        for key, default, enhance in _ENHANCEMENTS:
+            value, delta = enhance(requirements.get(key, default))
+            successors.append(PrioritizedNode(
+                priority=-(parent_h + delta),
+                requirements={**requirements, key: value},
+                depth=depth,
+            ))
 
         return successors
 
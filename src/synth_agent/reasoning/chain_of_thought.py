@@ -6,11 +6,18 @@ requiring step-by-step logical reasoning.
 """
 
 from typing import Dict, Any, List, Optional
-import copy
+import re
 
 from .base import BaseReasoningStrategy, ReasoningResult
 
 
+# Field-name keywords for count-like fields (substrings of the lower-cased name)
+_COUNT_FIELD_RE = re.compile("count|quantity")
+
+_NUMERIC_TYPES = frozenset(("integer", "number", "float"))
+_ID_FIELD_NAMES = frozenset(("id", "identifier", "name"))
+
+
 class ChainOfThoughtReasoner(BaseReasoningStrategy):
     """
     Chain of Thought reasoning strategy.
@@ -44,17 +51,23 @@ class ChainOfThoughtReasoner(BaseReasoningStrategy):
         """
         self.logger.info("Starting Chain of Thought reasoning")
 
-        enhanced = copy.deepcopy(requirements)
+        # Shallow copy; each step copies the containers it modifies so the
+        # caller's requirements are never mutated
+        enhanced = dict(requirements)
         reasoning_steps = ["Starting Chain of Thought analysis"]
 
         # Step 1: Understand the domain
         domain = self._extract_domain(enhanced)
         reasoning_steps.append(f"Step 1: Identified domain as '{domain or 'general'}'")
 
-        # Step 2: Analyze field requirements
+        # Step 2: Analyze field requirements. The same pass over the fields
+        # also finds foreign key candidates (step 4) and fields without a
+        # type (step 6).
+        foreign_keys: List[str] = []
+        missing_types: List[str] = []
         if "fields" in enhanced:
             reasoning_steps.append("Step 2: Analyzing field requirements")
-            enhanced, field_insights = self._analyze_fields(enhanced)
+            enhanced, field_insights, foreign_keys, missing_types = self._analyze_fields(enhanced)
             reasoning_steps.extend(field_insights)
 
         # Step 3: Identify implicit constraints
@@ -64,7 +77,7 @@ class ChainOfThoughtReasoner(BaseReasoningStrategy):
 
         # Step 4: Determine relationships
         reasoning_steps.append("Step 4: Determining field relationships")
-        enhanced, relationship_insights = self._determine_relationships(enhanced)
+        enhanced, relationship_insights = self._determine_relationships(enhanced, foreign_keys)
         reasoning_steps.extend(relationship_insights)
 
         # Step 5: Add quality requirements
@@ -74,7 +87,7 @@ class ChainOfThoughtReasoner(BaseReasoningStrategy):
 
         # Step 6: Validate consistency
         reasoning_steps.append("Step 6: Validating requirement consistency")
-        consistency_check = self._validate_consistency(enhanced)
+        consistency_check = self._validate_consistency(enhanced, missing_types)
         reasoning_steps.extend(consistency_check)
 
         confidence = self._calculate_confidence(enhanced)
@@ -99,37 +112,57 @@ class ChainOfThoughtReasoner(BaseReasoningStrategy):
     def _analyze_fields(
         self,
         requirements: Dict[str, Any],
-    ) -> tuple[Dict[str, Any], List[str]]:
-        """Analyze and enhance field specifications."""
+    ) -> tuple[Dict[str, Any], List[str], List[str], List[str]]:
+        """
+        Analyze and enhance field specifications in a single pass.
+
+        Returns:
+            Tuple of (requirements, insights, names of foreign key fields,
+            names of fields without a type)
+        """
         insights = []
-        fields = requirements.get("fields", [])
+        foreign_keys = []
+        missing_types = []
+        fields = [
+            dict(field) if isinstance(field, dict) else field
+            for field in requirements["fields"]
+        ]
+        requirements["fields"] = fields
 
         for field in fields:
-            if isinstance(field, dict):
-                field_name = field.get("name", "unknown")
-                field_type = field.get("type", "string")
-
-                # Add type-specific constraints
-                if field_type in ["integer", "number", "float"]:
-                    if "constraints" not in field:
-                        field["constraints"] = {}
-                    if "min" not in field["constraints"] and "max" not in field["constraints"]:
-                        # Infer reasonable ranges based on name
-                        if "age" in field_name.lower():
-                            field["constraints"]["min"] = 0
-                            field["constraints"]["max"] = 120
-                            insights.append(f"  → Inferred age range (0-120) for field '{field_name}'")
-                        elif "count" in field_name.lower() or "quantity" in field_name.lower():
-                            field["constraints"]["min"] = 0
-                            insights.append(f"  → Set minimum 0 for count field '{field_name}'")
-
-                # Check for required fields
-                if field_name.lower() in ["id", "identifier", "name"]:
-                    field["required"] = True
-                    field["unique"] = True
-                    insights.append(f"  → Marked '{field_name}' as required and unique")
-
-        return requirements, insights
+            if not isinstance(field, dict):
+                continue
+            field_name = field.get("name", "unknown")
+            lowered = field_name.lower()
+
+            # Add type-specific constraints
+            if field.get("type", "string") in _NUMERIC_TYPES:
+                constraints = field["constraints"] = dict(field.get("constraints", {}))
+                if "min" not in constraints and "max" not in constraints:
+                    # Infer reasonable ranges based on name
+                    if "age" in lowered:
+                        constraints["min"] = 0
+                        constraints["max"] = 120
+                        insights.append(f"  → Inferred age range (0-120) for field '{field_name}'")
+                    elif _COUNT_FIELD_RE.search(lowered):
+                        constraints["min"] = 0
+                        insights.append(f"  → Set minimum 0 for count field '{field_name}'")
+
+            # Check for required fields
+            if lowered in _ID_FIELD_NAMES:
+                field["required"] = True
+                field["unique"] = True
+                insights.append(f"  → Marked '{field_name}' as required and unique")
+
+            # Foreign key candidates, for relationship detection
+            if "_id" in lowered and lowered != "id":
+                foreign_keys.append(field_name)
+
+            # Untyped fields, for the consistency check
+            if "type" not in field:
+                missing_types.append(field_name)
+
+        return requirements, insights, foreign_keys, missing_types
 
     def _identify_constraints(
         self,
@@ -139,20 +172,23 @@ class ChainOfThoughtReasoner(BaseReasoningStrategy):
         """Identify implicit constraints based on domain."""
         insights = []
 
-        if "constraints" not in requirements:
-            requirements["constraints"] = []
+        # One lookup and one store; lists are copied so the caller's list
+        # is not modified
+        constraints = requirements.get("constraints", [])
+        if isinstance(constraints, list):
+            constraints = requirements["constraints"] = list(constraints)
 
         # Domain-specific constraints
         if domain == "healthcare":
-            requirements["constraints"].append("HIPAA compliance required")
-            requirements["constraints"].append("PHI data must be anonymizable")
+            constraints.append("HIPAA compliance required")
+            constraints.append("PHI data must be anonymizable")
             insights.append("  → Added healthcare compliance constraints")
         elif domain == "financial":
-            requirements["constraints"].append("Transactions must balance")
-            requirements["constraints"].append("Amounts must have 2 decimal precision")
+            constraints.append("Transactions must balance")
+            constraints.append("Amounts must have 2 decimal precision")
             insights.append("  → Added financial integrity constraints")
         elif domain == "legal":
-            requirements["constraints"].append("All fields must be auditable")
+            constraints.append("All fields must be auditable")
             insights.append("  → Added legal auditability constraint")
 
         return requirements, insights
@@ -160,26 +196,24 @@ class ChainOfThoughtReasoner(BaseReasoningStrategy):
     def _determine_relationships(
         self,
         requirements: Dict[str, Any],
+        foreign_keys: List[str],
     ) -> tuple[Dict[str, Any], List[str]]:
         """Determine relationships between fields."""
         insights = []
-        fields = requirements.get("fields", [])
-
-        if "relationships" not in requirements:
-            requirements["relationships"] = []
 
-        # Look for foreign key relationships
-        field_names = [f.get("name", "") for f in fields if isinstance(f, dict)]
+        relationships = requirements.get("relationships", [])
+        if isinstance(relationships, list):
+            relationships = requirements["relationships"] = list(relationships)
 
-        for name in field_names:
-            if "_id" in name.lower() and name.lower() != "id":
-                parent = name.replace("_id", "").replace("_ID", "")
-                requirements["relationships"].append({
-                    "type": "foreign_key",
-                    "from": name,
-                    "to": f"{parent}.id",
-                })
-                insights.append(f"  → Detected foreign key relationship: {name} → {parent}.id")
+        # Add foreign key relationships
+        for name in foreign_keys:
+            parent = name.replace("_id", "").replace("_ID", "")
+            relationships.append({
+                "type": "foreign_key",
+                "from": name,
+                "to": f"{parent}.id",
+            })
+            insights.append(f"  → Detected foreign key relationship: {name} → {parent}.id")
 
         return requirements, insights
 
@@ -191,10 +225,9 @@ class ChainOfThoughtReasoner(BaseReasoningStrategy):
         """Add quality requirements based on domain."""
         insights = []
 
-        if "quality_requirements" not in requirements:
-            requirements["quality_requirements"] = {}
-
-        quality = requirements["quality_requirements"]
+        quality = requirements.get("quality_requirements", {})
+        if isinstance(quality, dict):
+            quality = requirements["quality_requirements"] = dict(quality)
 
         # Domain-specific quality requirements
         if domain in ["healthcare", "legal", "financial"]:
@@ -211,7 +244,11 @@ class ChainOfThoughtReasoner(BaseReasoningStrategy):
 
         return requirements, insights
 
-    def _validate_consistency(self, requirements: Dict[str, Any]) -> List[str]:
+    def _validate_consistency(
+        self,
+        requirements: Dict[str, Any],
+        missing_types: List[str],
+    ) -> List[str]:
         """Validate requirement consistency."""
         checks = []
 
@@ -224,12 +261,6 @@ class ChainOfThoughtReasoner(BaseReasoningStrategy):
                 checks.append("  ⚠ Small dataset size may not show pattern diversity")
 
         # Check if all required fields have types
-        fields = requirements.get("fields", [])
-        missing_types = [
-            f.get("name", "unknown")
-            for f in fields
-            if isinstance(f, dict) and "type" not in f
-        ]
         if missing_types:
             checks.append(f"  ⚠ Fields missing type specification: {', '.join(missing_types)}")
         else:
@@ -253,7 +284,7 @@ class ChainOfThoughtReasoner(BaseReasoningStrategy):
         if "constraints" in requirements and requirements["constraints"]:
             score += 0.1
 
-        return min(1.0, score)
+        return score if score < 1.0 else 1.0
 
     def get_metadata(self) -> Dict[str, Any]:
         """Get metadata about Chain of Thought reasoning."""
@@ -5,31 +5,35 @@ This engine manages the execution of reasoning methods and provides
 a unified interface for applying reasoning to data generation.
 """
 
+import importlib
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import structlog
 
 from .base import BaseReasoningStrategy, ReasoningResult
 from .strategy_selector import StrategySelector
 from .metrics import ReasoningMetrics, get_metrics_tracker
 
-# Import reasoning strategies (will be implemented)
-from .mcts_reasoner import MCTSReasoner
-from .beam_search_reasoner import BeamSearchReasoner
-from .chain_of_thought import ChainOfThoughtReasoner
-from .tree_of_thoughts import TreeOfThoughtsReasoner
-from .self_consistency import SelfConsistencyReasoner
-from .react_reasoner import ReActReasoner
-from .reflexion_reasoner import ReflexionReasoner
-from .best_first_search import BestFirstSearchReasoner
-from .astar_reasoner import AStarReasoner
-from .meta_prompting import MetaPromptingReasoner
-from .iterative_refinement import IterativeRefinementReasoner
-from .graph_of_thoughts import GraphOfThoughtsReasoner
-
 
 logger = structlog.get_logger(__name__)
 
+# Reasoning strategies by method name: (submodule, class name). Modules are
+# imported and strategies instantiated on first use.
+_STRATEGY_CLASSES: Dict[str, Tuple[str, str]] = {
+    "mcts": ("mcts_reasoner", "MCTSReasoner"),
+    "beam_search": ("beam_search_reasoner", "BeamSearchReasoner"),
+    "chain_of_thought": ("chain_of_thought", "ChainOfThoughtReasoner"),
+    "tree_of_thoughts": ("tree_of_thoughts", "TreeOfThoughtsReasoner"),
+    "self_consistency": ("self_consistency", "SelfConsistencyReasoner"),
+    "react": ("react_reasoner", "ReActReasoner"),
+    "reflexion": ("reflexion_reasoner", "ReflexionReasoner"),
+    "best_first_search": ("best_first_search", "BestFirstSearchReasoner"),
+    "astar": ("astar_reasoner", "AStarReasoner"),
+    "meta_prompting": ("meta_prompting", "MetaPromptingReasoner"),
+    "iterative_refinement": ("iterative_refinement", "IterativeRefinementReasoner"),
+    "graph_of_thoughts": ("graph_of_thoughts", "GraphOfThoughtsReasoner"),
+}
+
 
 class ReasoningEngine:
     """
@@ -53,23 +57,10 @@ class ReasoningEngine:
         self.selector = StrategySelector(config)
         self.metrics_tracker = get_metrics_tracker()
 
-        # Initialize all reasoning strategies
-        self.strategies: Dict[str, BaseReasoningStrategy] = {
-            "mcts": MCTSReasoner(config),
-            "beam_search": BeamSearchReasoner(config),
-            "chain_of_thought": ChainOfThoughtReasoner(config),
-            "tree_of_thoughts": TreeOfThoughtsReasoner(config),
-            "self_consistency": SelfConsistencyReasoner(config),
-            "react": ReActReasoner(config),
-            "reflexion": ReflexionReasoner(config),
-            "best_first_search": BestFirstSearchReasoner(config),
-            "astar": AStarReasoner(config),
-            "meta_prompting": MetaPromptingReasoner(config),
-            "iterative_refinement": IterativeRefinementReasoner(config),
-            "graph_of_thoughts": GraphOfThoughtsReasoner(config),
-        }
-
-        logger.info("ReasoningEngine initialized", strategies_count=len(self.strategies))
+        # Strategy instances created so far; see _instantiate
+        self.strategies: Dict[str, BaseReasoningStrategy] = {}
+
+        logger.info("ReasoningEngine initialized", strategies_count=len(_STRATEGY_CLASSES))
 
     async def execute(
         self,
@@ -91,19 +82,18 @@ class ReasoningEngine:
         Raises:
             ValueError: If method is not available
         """
-        if method not in self.strategies:
-            available = ", ".join(self.strategies.keys())
+        if method not in _STRATEGY_CLASSES:
+            available = ", ".join(_STRATEGY_CLASSES)
             raise ValueError(
                 f"Unknown reasoning method: {method}. Available: {available}"
             )
 
-        strategy = self.strategies[method]
+        strategy = self.strategies.get(method) or self._instantiate(method)
         logger.info("Executing reasoning strategy", method=method)
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         success = True
         error_message = ""
-        result = None
 
         try:
             # Validate requirements
@@ -129,27 +119,29 @@ class ReasoningEngine:
                 metadata={"error": error_message},
             )
 
-        finally:
-            execution_time = time.time() - start_time
-            result.execution_time = execution_time
-
-            # Record metrics
-            metrics = ReasoningMetrics(
-                method_name=method,
-                execution_time=execution_time,
-                confidence_score=result.confidence,
-                steps_count=len(result.reasoning_steps),
-                success=success,
-                error_message=error_message,
-                metadata=result.metadata,
-            )
-            self.metrics_tracker.record(metrics)
+        # Not in a finally block: on cancellation there is no result to
+        # record, and touching it would mask the CancelledError
+        execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+        result.execution_time = execution_time
+        confidence = result.confidence
+
+        # Record metrics
+        metrics = ReasoningMetrics(
+            method_name=method,
+            execution_time=execution_time,
+            confidence_score=confidence,
+            steps_count=len(result.reasoning_steps),
+            success=success,
+            error_message=error_message,
+            metadata=result.metadata,
+        )
+        self.metrics_tracker.record(metrics)
 
         logger.info(
             "Reasoning execution completed",
             method=method,
             execution_time=execution_time,
-            confidence=result.confidence,
+            confidence=confidence,
             success=success,
         )
 
@@ -198,7 +190,25 @@ class ReasoningEngine:
         Returns:
             Strategy instance or None
         """
-        return self.strategies.get(method)
+        if method not in _STRATEGY_CLASSES:
+            return None
+        return self.strategies.get(method) or self._instantiate(method)
+
+    def _instantiate(self, method: str) -> BaseReasoningStrategy:
+        """
+        Import and create the strategy for a method, caching the instance.
+
+        Args:
+            method: Method name (must be a key of _STRATEGY_CLASSES)
+
+        Returns:
+            Strategy instance
+        """
+        module_name, class_name = _STRATEGY_CLASSES[method]
+        module = importlib.import_module(f".{module_name}", __package__)
+        strategy = getattr(module, class_name)(self.config)
+        self.strategies[method] = strategy
+        return strategy
 
     def list_strategies(self) -> list[str]:
         """
@@ -207,7 +217,7 @@ class ReasoningEngine:
         Returns:
             List of strategy names
         """
-        return list(self.strategies.keys())
+        return list(_STRATEGY_CLASSES)
 
     def get_metrics_summary(self, method: Optional[str] = None) -> Dict[str, Any]:
         """
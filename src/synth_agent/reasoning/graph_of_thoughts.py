@@ -7,12 +7,11 @@ about data as interconnected graphs is beneficial.
 
 from typing import Dict, Any, List, Optional, Set
 from dataclasses import dataclass, field
-import copy
 
 from .base import BaseReasoningStrategy, ReasoningResult
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphNode:
     """Node in the graph of thoughts."""
     id: str
@@ -138,28 +137,32 @@ class GraphOfThoughtsReasoner(BaseReasoningStrategy):
                         graph[from_id].connections.add(to_id)
                         graph[to_id].connections.add(from_id)
 
-        # Infer connections from field names
-        field_nodes = [n for n in graph.values() if n.id.startswith("field_")]
-        for i, node1 in enumerate(field_nodes):
-            for node2 in field_nodes[i + 1:]:
-                # Connect if names are similar (simple heuristic)
-                name1 = node1.id.replace("field_", "").lower()
-                name2 = node2.id.replace("field_", "").lower()
-
-                if self._are_related(name1, name2):
+        # Infer connections from field names: fields sharing a word are
+        # related. Index fields by word so only fields that share one are
+        # paired, instead of comparing every pair of fields.
+        nodes_by_word: Dict[str, List[GraphNode]] = {}
+        for node in graph.values():
+            if node.id.startswith("field_"):
+                for word in self._name_words(node.id.replace("field_", "").lower()):
+                    nodes_by_word.setdefault(word, []).append(node)
+
+        for nodes in nodes_by_word.values():
+            for i, node1 in enumerate(nodes):
+                for node2 in nodes[i + 1:]:
                     node1.connections.add(node2.id)
                     node2.connections.add(node1.id)
 
         return graph
 
+    @staticmethod
+    def _name_words(name: str) -> Set[str]:
+        """Split a field name into its words."""
+        return set(name.replace("_", " ").split())
+
     def _are_related(self, name1: str, name2: str) -> bool:
         """Check if two field names are semantically related."""
         # Simple heuristic: share common words
-        words1 = set(name1.replace("_", " ").split())
-        words2 = set(name2.replace("_", " ").split())
-
-        common = words1 & words2
-        return len(common) > 0
+        return not self._name_words(name1).isdisjoint(self._name_words(name2))
 
     def _analyze_graph(self, graph: Dict[str, GraphNode]) -> Dict[str, Any]:
         """Analyze graph structure."""
@@ -170,14 +173,42 @@ class GraphOfThoughtsReasoner(BaseReasoningStrategy):
                 "density": 0.0,
             }
 
-        # Count connected components (simplified - just count isolated nodes)
-        isolated = sum(1 for node in graph.values() if not node.connections)
-        connected = len(graph) - isolated
-        components = isolated + (1 if connected > 0 else 0)
+        # Count connected components with union-find over node indices,
+        # summing degrees in the same pass
+        index = {node_id: i for i, node_id in enumerate(graph)}
+        parent = list(range(len(graph)))
+        size = [1] * len(graph)
+        components = len(graph)
+        total_connections = 0
+
+        for i, node in enumerate(graph.values()):
+            total_connections += len(node.connections)
+            for neighbor in node.connections:
+                j = index.get(neighbor)
+                if j is None or j <= i:
+                    # Unknown node, or an edge already seen from the other end
+                    continue
+
+                # Find both roots, halving paths on the way up
+                root_i = i
+                while parent[root_i] != root_i:
+                    parent[root_i] = parent[parent[root_i]]
+                    root_i = parent[root_i]
+                root_j = j
+                while parent[root_j] != root_j:
+                    parent[root_j] = parent[parent[root_j]]
+                    root_j = parent[root_j]
+
+                if root_i != root_j:
+                    # Attach the smaller tree under the larger one
+                    if size[root_i] < size[root_j]:
+                        root_i, root_j = root_j, root_i
+                    parent[root_j] = root_i
+                    size[root_i] += size[root_j]
+                    components -= 1
 
         # Average connections
-        total_connections = sum(len(node.connections) for node in graph.values())
-        avg_connections = total_connections / len(graph) if graph else 0.0
+        avg_connections = total_connections / len(graph)
 
         # Density
         n = len(graph)
@@ -198,34 +229,32 @@ class GraphOfThoughtsReasoner(BaseReasoningStrategy):
         analysis: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Enhance requirements based on graph insights."""
-        enhanced = copy.deepcopy(requirements)
+        # Shallow copy; the three containers modified below are rebuilt, so
+        # the caller's requirements are never mutated
+        enhanced = dict(requirements)
 
         # Add graph properties
-        if "graph_properties" not in enhanced:
-            enhanced["graph_properties"] = {}
-
-        enhanced["graph_properties"].update({
+        enhanced["graph_properties"] = {
+            **enhanced.get("graph_properties", {}),
             "is_graph_data": True,
             "node_count": len(graph),
             "avg_degree": analysis["avg_connections"],
             "density": analysis["density"],
-        })
+        }
 
         # Add network-specific constraints
-        if "constraints" not in enhanced:
-            enhanced["constraints"] = []
-
-        enhanced["constraints"].extend([
+        enhanced["constraints"] = [
+            *enhanced.get("constraints", ()),
             "Maintain graph connectivity",
             "Preserve degree distribution",
             "Ensure bidirectional edges",
-        ])
+        ]
 
         # Enhance quality for graph data
-        if "quality_requirements" not in enhanced:
-            enhanced["quality_requirements"] = {}
-
-        enhanced["quality_requirements"]["graph_consistency"] = True
+        enhanced["quality_requirements"] = {
+            **enhanced.get("quality_requirements", {}),
+            "graph_consistency": True,
+        }
 
         return enhanced
 
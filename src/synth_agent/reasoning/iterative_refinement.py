@@ -6,9 +6,13 @@ through multiple passes. Suitable for all domains.
 """
 
 from typing import Dict, Any, List, Optional
-import copy
 
-from .base import BaseReasoningStrategy, ReasoningResult
+from .base import BaseReasoningStrategy, ReasoningResult, fast_deepcopy
+
+
+# Requirements key each refinement pass modifies, by pass index; later passes
+# (final polish) only touch metadata, which does not affect quality
+_PASS_KEYS = ("fields", "constraints", "quality_requirements", "relationships")
 
 
 class IterativeRefinementReasoner(BaseReasoningStrategy):
@@ -49,13 +53,16 @@ class IterativeRefinementReasoner(BaseReasoningStrategy):
             max_iterations=self.max_iterations,
         )
 
-        current = copy.deepcopy(requirements)
+        current = fast_deepcopy(requirements)
         reasoning_steps = [
             "Starting Iterative Refinement",
             f"Maximum refinement passes: {self.max_iterations}",
         ]
 
         quality_scores = []
+        # Score contributions per key; each pass changes one key, so only
+        # that key is rescored
+        components = self._quality_components(current)
 
         for iteration in range(self.max_iterations):
             reasoning_steps.append(f"\n--- Refinement Pass {iteration + 1} ---")
@@ -66,7 +73,10 @@ class IterativeRefinementReasoner(BaseReasoningStrategy):
             reasoning_steps.extend(refinements)
 
             # Evaluate quality
-            quality = self._evaluate_quality(current)
+            if iteration < len(_PASS_KEYS):
+                key = _PASS_KEYS[iteration]
+                components[key] = self._quality_component(current, key)
+            quality = self._combine_quality(components)
             quality_scores.append(quality)
 
             reasoning_steps.append(f"Quality score: {quality:.3f}")
@@ -105,9 +115,14 @@ class IterativeRefinementReasoner(BaseReasoningStrategy):
         requirements: Dict[str, Any],
         iteration: int,
     ) -> tuple[Dict[str, Any], List[str]]:
-        """Perform one refinement pass."""
+        """
+        Perform one refinement pass.
+
+        ``requirements`` is refined in place; reason() passes its own deep
+        copy of the caller's requirements, so no per-pass copy is needed.
+        """
         refinements = []
-        refined = copy.deepcopy(requirements)
+        refined = requirements
 
         # Pass 1: Enhance field specifications
         if iteration == 0:
@@ -213,21 +228,20 @@ class IterativeRefinementReasoner(BaseReasoningStrategy):
             refinements.append("  + Initialized relationships list")
 
         # Detect potential relationships
-        if "fields" in requirements:
-            field_names = [
-                f.get("name", "") for f in requirements["fields"]
-                if isinstance(f, dict)
-            ]
-
-            for name in field_names:
-                if "_id" in name.lower() and name.lower() != "id":
-                    parent = name.replace("_id", "").replace("_ID", "")
-                    requirements["relationships"].append({
-                        "type": "foreign_key",
-                        "from": name,
-                        "to": f"{parent}.id",
-                    })
-                    refinements.append(f"  + Detected relationship: {name} → {parent}.id")
+        relationships = requirements["relationships"]
+        for field in requirements.get("fields", ()):
+            if not isinstance(field, dict):
+                continue
+            name = field.get("name", "")
+            # Any name containing "_id" (which also rules out a plain "id")
+            if "_id" in name.lower():
+                parent = name.replace("_id", "").replace("_ID", "")
+                relationships.append({
+                    "type": "foreign_key",
+                    "from": name,
+                    "to": f"{parent}.id",
+                })
+                refinements.append(f"  + Detected relationship: {name} → {parent}.id")
 
         return requirements, refinements
 
@@ -254,34 +268,55 @@ class IterativeRefinementReasoner(BaseReasoningStrategy):
 
     def _evaluate_quality(self, requirements: Dict[str, Any]) -> float:
         """Evaluate current quality of requirements."""
-        score = 0.2  # Base score
+        return self._combine_quality(self._quality_components(requirements))
 
-        # Field completeness
-        if "fields" in requirements:
-            fields = requirements["fields"]
-            if fields:
-                score += 0.2
+    def _quality_components(self, requirements: Dict[str, Any]) -> Dict[str, tuple[float, ...]]:
+        """Score contributions of every key that affects quality."""
+        return {key: self._quality_component(requirements, key) for key in _PASS_KEYS}
 
-                # Check field details
-                complete_fields = sum(
-                    1 for f in fields
-                    if isinstance(f, dict) and "type" in f and "description" in f
-                )
+    def _quality_component(self, requirements: Dict[str, Any], key: str) -> tuple[float, ...]:
+        """
+        Score contributions of one requirements key.
 
-                if complete_fields == len(fields):
-                    score += 0.2
+        Args:
+            requirements: Requirements to score
+            key: One of the keys in _PASS_KEYS
+
+        Returns:
+            Increments the key adds to the base score, in order
+        """
+        # Field completeness
+        if key == "fields":
+            fields = requirements.get("fields")
+            if not fields:
+                return ()
+
+            # Check field details
+            complete_fields = sum(
+                1 for f in fields
+                if isinstance(f, dict) and "type" in f and "description" in f
+            )
+            return (0.2, 0.2) if complete_fields == len(fields) else (0.2,)
 
         # Constraints
-        if "constraints" in requirements and requirements["constraints"]:
-            score += 0.1
+        if key == "constraints":
+            return (0.1,) if requirements.get("constraints") else ()
 
         # Quality requirements
-        if "quality_requirements" in requirements:
-            score += 0.15
+        if key == "quality_requirements":
+            return (0.15,) if "quality_requirements" in requirements else ()
 
         # Relationships
-        if "relationships" in requirements and requirements["relationships"]:
-            score += 0.15
+        return (0.15,) if requirements.get("relationships") else ()
+
+    @staticmethod
+    def _combine_quality(components: Dict[str, tuple[float, ...]]) -> float:
+        """Add per-key contributions to the base score, in _PASS_KEYS order."""
+        score = 0.2  # Base score
+
+        for key in _PASS_KEYS:
+            for increment in components[key]:
+                score += increment
 
         return min(1.0, score)
 
@@ -8,24 +8,21 @@ of multiple generation paths to find optimal distributions.
 import random
 import math
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
-import copy
+from dataclasses import dataclass, field
 
-from .base import BaseReasoningStrategy, ReasoningResult
+from .base import BaseReasoningStrategy, ReasoningResult, fast_deepcopy
 
 
-@dataclass
+@dataclass(slots=True)
 class MCTSNode:
     """Node in the MCTS tree."""
     requirements: Dict[str, Any]
     visits: int = 0
     value: float = 0.0
     parent: Optional['MCTSNode'] = None
-    children: List['MCTSNode'] = None
-
-    def __post_init__(self):
-        if self.children is None:
-            self.children = []
+    children: List['MCTSNode'] = field(default_factory=list)
+    # Deterministic part of the simulated score (see _base_score)
+    base_score: float = 0.0
 
 
 class MCTSReasoner(BaseReasoningStrategy):
@@ -72,8 +69,13 @@ class MCTSReasoner(BaseReasoningStrategy):
             f"Running {self.iterations} simulations",
         ]
 
-        # Create root node
-        root = MCTSNode(requirements=copy.deepcopy(requirements))
+        # Create root node. No copy is needed: variations copy whatever they
+        # modify, so the caller's requirements are never mutated. The result
+        # is copied once at the end since it still shares unchanged parts.
+        root = MCTSNode(
+            requirements=requirements,
+            base_score=self._base_score(requirements),
+        )
 
         # Run MCTS iterations
         for i in range(self.iterations):
@@ -111,7 +113,7 @@ class MCTSReasoner(BaseReasoningStrategy):
         )
 
         return ReasoningResult(
-            enhanced_requirements=best_node.requirements,
+            enhanced_requirements=fast_deepcopy(best_node.requirements),
             reasoning_steps=reasoning_steps,
             confidence=confidence,
             metadata={
@@ -125,9 +127,37 @@ class MCTSReasoner(BaseReasoningStrategy):
     def _select(self, node: MCTSNode) -> MCTSNode:
         """Select most promising node using UCB1."""
         while node.children:
-            node = max(node.children, key=lambda n: self._ucb1(n))
+            node = self._best_child(node)
         return node
 
+    def _best_child(self, node: MCTSNode) -> MCTSNode:
+        """
+        Pick the child with the highest UCB1 score.
+
+        Same result as ``max(node.children, key=self._ucb1)``, but the
+        parent's log visit count is computed once per node rather than once
+        per child, and the first unvisited child (infinite score) is taken
+        without scoring the rest.
+        """
+        log_parent_visits = math.log(node.visits)
+        exploration_factor = self.exploration_factor
+        best = None
+        best_score = float('-inf')
+
+        for child in node.children:
+            visits = child.visits
+            if visits == 0:
+                return child
+
+            score = child.value / visits + exploration_factor * math.sqrt(
+                log_parent_visits / visits
+            )
+            if score > best_score:
+                best = child
+                best_score = score
+
+        return best
+
     def _ucb1(self, node: MCTSNode) -> float:
         """Calculate UCB1 score for node selection."""
         if node.visits == 0:
@@ -144,17 +174,37 @@ class MCTSReasoner(BaseReasoningStrategy):
         # Create variations of requirements
         child_requirements = self._create_variation(node.requirements)
 
+        # Nothing left to vary: a child would duplicate this node, so
+        # simulate the node again instead of growing the tree. Variations
+        # only add settings, so this is the only way a duplicate can arise.
+        # The root still gets a child so there is a variation to return.
+        if child_requirements is node.requirements and node.parent is not None:
+            return node
+
+        # A variation only ensures quality requirements exist and adds
+        # distribution hints, so its base score follows from the parent's
+        # (adding the quality term last, exactly as _base_score does)
+        base_score = node.base_score
+        if "quality_requirements" not in node.requirements:
+            base_score += 0.15
+
         child = MCTSNode(
             requirements=child_requirements,
             parent=node,
+            base_score=base_score,
         )
         node.children.append(child)
         return child
 
     def _simulate(self, node: MCTSNode) -> float:
         """Simulate quality of requirements."""
-        requirements = node.requirements
+        # Add randomness to simulate uncertainty
+        score = node.base_score + random.uniform(-0.1, 0.1)
 
+        return max(0.0, min(1.0, score))
+
+    def _base_score(self, requirements: Dict[str, Any]) -> float:
+        """Score requirements on completeness and consistency, before noise."""
         # Quality scoring based on completeness and consistency
         score = 0.0
 
@@ -184,10 +234,7 @@ class MCTSReasoner(BaseReasoningStrategy):
         if "quality_requirements" in requirements:
             score += 0.15
 
-        # Add randomness to simulate uncertainty
-        score += random.uniform(-0.1, 0.1)
-
-        return max(0.0, min(1.0, score))
+        return score
 
     def _backpropagate(self, node: MCTSNode, value: float) -> None:
         """Backpropagate value up the tree."""
@@ -197,34 +244,49 @@ class MCTSReasoner(BaseReasoningStrategy):
             node = node.parent
 
     def _create_variation(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a variation of requirements."""
-        variation = copy.deepcopy(requirements)
+        """
+        Create a variation of requirements.
 
-        # Add quality enhancements for financial data
-        if "quality_requirements" not in variation:
-            variation["quality_requirements"] = {}
+        Returns:
+            The varied requirements, or ``requirements`` itself when every
+            setting it would add is already present
+        """
+        # Shallow copy; the quality requirements and any field that gains a
+        # distribution are copied before being modified, everything else is
+        # shared with the parent node
+        variation = dict(requirements)
+        changed = "quality_requirements" not in requirements
 
-        # Enhance quality requirements
-        quality = variation["quality_requirements"]
+        # Add quality enhancements for financial data
+        quality = variation["quality_requirements"] = dict(
+            variation.get("quality_requirements", {})
+        )
 
         # Financial data often needs high precision
         if "precision" not in quality:
             quality["precision"] = random.choice(["high", "very_high"])
+            changed = True
 
         # Financial data needs referential integrity
         if "referential_integrity" not in quality:
             quality["referential_integrity"] = True
+            changed = True
 
         # Add distribution hints for numeric fields
-        if "fields" in variation:
-            for field in variation.get("fields", []):
+        if isinstance(variation.get("fields"), list):
+            fields = []
+            for field in variation["fields"]:
                 if isinstance(field, dict) and field.get("type") in ["number", "integer", "float"]:
                     if "distribution" not in field:
-                        field["distribution"] = random.choice(
-                            ["normal", "lognormal", "uniform"]
-                        )
-
-        return variation
+                        field = {
+                            **field,
+                            "distribution": random.choice(["normal", "lognormal", "uniform"]),
+                        }
+                        changed = True
+                fields.append(field)
+            variation["fields"] = fields
+
+        return variation if changed else requirements
 
     def get_metadata(self) -> Dict[str, Any]:
         """Get metadata about MCTS reasoning."""
@@ -6,9 +6,8 @@ selection based on dynamic analysis of requirements.
 """
 
 from typing import Dict, Any, List, Optional
-import copy
 
-from .base import BaseReasoningStrategy, ReasoningResult
+from .base import BaseReasoningStrategy, ReasoningResult, fast_deepcopy
 
 
 class MetaPromptingReasoner(BaseReasoningStrategy):
@@ -55,7 +54,7 @@ class MetaPromptingReasoner(BaseReasoningStrategy):
         ])
 
         # Phase 2: Apply adaptive enhancements
-        enhanced = copy.deepcopy(requirements)
+        enhanced = fast_deepcopy(requirements)
 
         if analysis["strategy"] == "constraint_focused":
             reasoning_steps.append("Applying constraint-focused enhancements")
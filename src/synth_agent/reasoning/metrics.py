@@ -4,13 +4,17 @@ Metrics tracking for reasoning operations.
 Tracks performance, quality, and usage statistics for reasoning methods.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, Any, Optional
 from datetime import datetime
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Number of most recent runs a tracker keeps
+DEFAULT_MAX_HISTORY = 1000
+
 
 @dataclass
 class ReasoningMetrics:
@@ -42,9 +46,17 @@ class ReasoningMetrics:
 class MetricsTracker:
     """Tracks and aggregates reasoning metrics."""
 
-    def __init__(self):
-        """Initialize metrics tracker."""
-        self.metrics_history: List[ReasoningMetrics] = []
+    def __init__(self, max_history: int = DEFAULT_MAX_HISTORY):
+        """
+        Initialize metrics tracker.
+
+        Args:
+            max_history: Number of most recent runs to keep; older runs are
+                dropped as new ones are recorded
+        """
+        # Ring buffer, so recording is O(1) and memory stays bounded in
+        # long-running processes
+        self.metrics_history: Deque[ReasoningMetrics] = deque(maxlen=max_history)
 
     def record(self, metrics: ReasoningMetrics) -> None:
         """
@@ -64,7 +76,7 @@ class MetricsTracker:
 
     def get_summary(self, method_name: Optional[str] = None) -> Dict[str, Any]:
         """
-        Get summary statistics.
+        Get summary statistics over the recorded runs.
 
         Args:
             method_name: Optional filter by method name
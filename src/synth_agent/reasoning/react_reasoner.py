@@ -6,9 +6,8 @@ external API checks or validation during the reasoning process.
 """
 
 from typing import Dict, Any, List, Optional
-import copy
 
-from .base import BaseReasoningStrategy, ReasoningResult
+from .base import BaseReasoningStrategy, ReasoningResult, fast_deepcopy
 
 
 class ReActReasoner(BaseReasoningStrategy):
@@ -40,7 +39,7 @@ class ReActReasoner(BaseReasoningStrategy):
         """
         self.logger.info("Starting ReAct reasoning")
 
-        enhanced = copy.deepcopy(requirements)
+        enhanced = fast_deepcopy(requirements)
         reasoning_steps = ["Starting ReAct (Reasoning + Acting)"]
 
         # Cycle 1: Reason about field types, then act (validate)
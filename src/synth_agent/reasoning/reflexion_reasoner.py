@@ -6,9 +6,8 @@ previous generation attempts improves subsequent results.
 """
 
 from typing import Dict, Any, List, Optional
-import copy
 
-from .base import BaseReasoningStrategy, ReasoningResult
+from .base import BaseReasoningStrategy, ReasoningResult, fast_deepcopy
 
 
 class ReflexionReasoner(BaseReasoningStrategy):
@@ -49,7 +48,7 @@ class ReflexionReasoner(BaseReasoningStrategy):
             max_iterations=self.max_iterations,
         )
 
-        current = copy.deepcopy(requirements)
+        current = fast_deepcopy(requirements)
         reasoning_steps = [
             "Starting Reflexion (Self-Reflection) reasoning",
             f"Maximum iterations: {self.max_iterations}",
@@ -81,7 +80,7 @@ class ReflexionReasoner(BaseReasoningStrategy):
             # Store in history
             history.append({
                 "iteration": iteration + 1,
-                "requirements": copy.deepcopy(current),
+                "requirements": fast_deepcopy(current),
                 "issues": issues,
             })
 
@@ -160,7 +159,7 @@ class ReflexionReasoner(BaseReasoningStrategy):
         issues: List[str],
     ) -> Dict[str, Any]:
         """Learn from issues and improve requirements."""
-        improved = copy.deepcopy(requirements)
+        improved = fast_deepcopy(requirements)
 
         # Fix missing types
         if any("missing type" in issue for issue in issues):
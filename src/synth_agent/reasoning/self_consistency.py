@@ -6,10 +6,9 @@ multiple independent solutions to ensure consistency.
 """
 
 from typing import Dict, Any, List, Optional
-import copy
 from collections import Counter
 
-from .base import BaseReasoningStrategy, ReasoningResult
+from .base import BaseReasoningStrategy, ReasoningResult, fast_deepcopy
 
 
 class SelfConsistencyReasoner(BaseReasoningStrategy):
@@ -94,7 +93,7 @@ class SelfConsistencyReasoner(BaseReasoningStrategy):
         sample_index: int,
     ) -> Dict[str, Any]:
         """Generate an independent enhancement."""
-        enhanced = copy.deepcopy(requirements)
+        enhanced = fast_deepcopy(requirements)
 
         # Add quality requirements (consistent across samples)
         if "quality_requirements" not in enhanced:
@@ -150,7 +149,7 @@ class SelfConsistencyReasoner(BaseReasoningStrategy):
                     feature_votes["validation_required"].append(validation)
 
         # Build most consistent solution
-        result = copy.deepcopy(candidates[0])
+        result = fast_deepcopy(candidates[0])
 
         # Apply majority votes
         if "quality_requirements" not in result:
@@ -7,9 +7,8 @@ requiring exploration of multiple reasoning branches.
 
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
-import copy
 
-from .base import BaseReasoningStrategy, ReasoningResult
+from .base import BaseReasoningStrategy, ReasoningResult, fast_deepcopy
 
 
 @dataclass
@@ -71,7 +70,7 @@ class TreeOfThoughtsReasoner(BaseReasoningStrategy):
         ]
 
         # Create root node
-        root = ThoughtNode(requirements=copy.deepcopy(requirements), depth=0)
+        root = ThoughtNode(requirements=fast_deepcopy(requirements), depth=0)
 
         # Build tree by exploring branches
         self._build_tree(root, reasoning_steps)
@@ -135,7 +134,7 @@ class TreeOfThoughtsReasoner(BaseReasoningStrategy):
         branch_index: int,
     ) -> Dict[str, Any]:
         """Generate a branch variation of requirements."""
-        branch = copy.deepcopy(requirements)
+        branch = fast_deepcopy(requirements)
 
         # Different enhancement strategies per branch
         if branch_index == 0:
@@ -1,5 +1,10 @@
 """Component tests for LLM integration."""
 
+import asyncio
+import json
+import threading
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch
 
 import pytest
@@ -70,6 +75,386 @@ class TestLLMExceptionHandling:
                 assert str(e) in str(error)
 
 
+class TestLLMProviderValidation:
+    """Component tests for provider API key validation."""
+
+    @pytest.mark.parametrize("provider_path", [
+        "synth_agent.llm.anthropic_provider.AnthropicProvider",
+        "synth_agent.llm.openai_provider.OpenAIProvider",
+    ])
+    def test_validate_api_key_lists_models(self, provider_path):
+        """Test validation is a synchronous models request."""
+        module_name, class_name = provider_path.rsplit(".", 1)
+        provider_class = getattr(__import__(module_name, fromlist=[class_name]), class_name)
+        provider = provider_class(api_key="test-key")
+
+        with patch("httpx.get", return_value=Mock(status_code=200)) as mock_get:
+            assert provider.validate_api_key() is True
+        assert mock_get.call_args.args[0].endswith("/models")
+
+        with patch("httpx.get", return_value=Mock(status_code=401)):
+            assert provider.validate_api_key() is False
+
+        with patch("httpx.get", side_effect=OSError("offline")):
+            assert provider.validate_api_key() is False
+
+    @pytest.mark.asyncio
+    async def test_validate_api_key_async_uses_async_client(self):
+        """Test async validation awaits the shared client instead of blocking."""
+        from unittest.mock import AsyncMock
+
+        from synth_agent.llm.openai_provider import OpenAIProvider
+
+        provider = OpenAIProvider(api_key="test-key")
+        client = Mock()
+        client.models.list = AsyncMock(return_value=[])
+        with patch("synth_agent.llm.openai_provider._get_client", return_value=client):
+            assert await provider.validate_api_key_async() is True
+
+            client.models.list = AsyncMock(side_effect=OSError("offline"))
+            assert await provider.validate_api_key_async() is False
+
+
+# Canned API responses served by the keep-alive test server, by request path
+_API_RESPONSES = {
+    "/v1/messages": {
+        "id": "msg_1",
+        "type": "message",
+        "role": "assistant",
+        "model": "claude-3-5-sonnet-20241022",
+        "content": [{"type": "text", "text": "pong"}],
+        "stop_reason": "end_turn",
+        "usage": {"input_tokens": 1, "output_tokens": 1},
+    },
+    "/chat/completions": {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4",
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": "pong"},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    },
+}
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers provider API calls over HTTP/1.1 so connections are pooled."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps(_API_RESPONSES[self.path]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def api_server():
+    """Serve canned provider responses on a local keep-alive HTTP server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestProviderClientCache:
+    """Component tests for the shared provider SDK clients."""
+
+    @pytest.mark.parametrize("module_name,class_name,sdk_name,base_url_env", [
+        ("anthropic_provider", "AnthropicProvider", "AsyncAnthropic", "ANTHROPIC_BASE_URL"),
+        ("openai_provider", "OpenAIProvider", "AsyncOpenAI", "OPENAI_BASE_URL"),
+    ])
+    def test_provider_survives_separate_event_loops(
+        self, api_server, monkeypatch, module_name, class_name, sdk_name, base_url_env
+    ):
+        """Test a provider keeps working after the loop that pooled its connection closes."""
+        module = __import__(f"synth_agent.llm.{module_name}", fromlist=[class_name])
+
+        monkeypatch.setenv(base_url_env, api_server)
+        monkeypatch.setattr(module, "_CLIENT_CACHE", {})
+        # Without SDK retries a pooled connection from a closed loop fails the call
+        monkeypatch.setattr(module, sdk_name, partial(getattr(module, sdk_name), max_retries=0))
+        provider = getattr(module, class_name)(api_key="test-key")
+
+        async def call():
+            response = await provider.complete("ping")
+            assert provider.client is provider.client
+            return response.content, provider.client
+
+        first_content, first_client = asyncio.run(call())
+        second_content, second_client = asyncio.run(call())
+
+        assert first_content == second_content == "pong"
+        assert first_client is not second_client
+        assert list(module._CLIENT_CACHE.values()) == [second_client]
+
+
+class FakeProvider:
+    """Provider stub that counts calls and echoes the prompt."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def complete(self, prompt, **kwargs):
+        from synth_agent.llm.base import LLMResponse
+
+        self.calls += 1
+        return LLMResponse(content=prompt, model="fake", usage={"total_tokens": 1})
+
+    async def chat(self, messages, **kwargs):
+        return await self.complete(messages[-1].content, **kwargs)
+
+
+class TestLLMManagerCache:
+    """Component tests for LLMManager response caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_is_served_from_cache(self):
+        """Test identical requests hit the provider once."""
+        from synth_agent.llm.manager import LLMManager
+
+        provider = FakeProvider()
+        manager = LLMManager(provider, Config())
+
+        first = await manager.complete("hello", temperature=0.1)
+        second = await manager.complete("hello", temperature=0.1)
+        await manager.complete("hello", temperature=0.2)
+
+        assert first is second
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_large_prompt_is_hashed_off_loop_and_cached(self):
+        """Test prompts above the offload threshold still share a cache entry."""
+        from synth_agent.llm import manager as manager_module
+
+        provider = FakeProvider()
+        manager = manager_module.LLMManager(provider, Config())
+        prompt = "x" * (manager_module._OFFLOAD_HASH_CHARS + 1)
+
+        to_thread = manager_module.asyncio.to_thread
+        with patch("synth_agent.llm.manager.asyncio.to_thread", wraps=to_thread) as to_thread:
+            await manager.complete(prompt)
+            await manager.complete(prompt)
+
+        assert to_thread.call_count == 2
+        assert provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_chat_cache_key_depends_on_roles_and_content(self):
+        """Test chat requests are cached per conversation."""
+        from synth_agent.llm.base import LLMMessage
+        from synth_agent.llm.manager import LLMManager
+
+        provider = FakeProvider()
+        manager = LLMManager(provider, Config())
+
+        conversation = [LLMMessage("system", "be brief"), LLMMessage("user", "hi")]
+        await manager.chat(conversation)
+        await manager.chat([LLMMessage("system", "be brief"), LLMMessage("user", "hi")])
+        assert provider.calls == 1
+
+        await manager.chat([LLMMessage("user", "be brief"), LLMMessage("user", "hi")])
+        assert provider.calls == 2
+
+    def test_system_prompt_key_uses_precomputed_bytes(self):
+        """Test the shared system prompt hashes like an equal string encoded per call."""
+        from synth_agent.llm.base import LLMMessage
+        from synth_agent.llm.manager import LLMManager
+        from synth_agent.llm.prompts import SYSTEM_PROMPT
+
+        manager = LLMManager(FakeProvider(), Config())
+        copied_prompt = "".join(SYSTEM_PROMPT)
+        assert copied_prompt is not SYSTEM_PROMPT
+
+        shared = [LLMMessage("system", SYSTEM_PROMPT), LLMMessage("user", "hi")]
+        copied = [LLMMessage("system", copied_prompt), LLMMessage("user", "hi")]
+        assert manager._get_messages_cache_key(shared, {}) == manager._get_messages_cache_key(
+            copied, {}
+        )
+
+    @pytest.mark.asyncio
+    async def test_eviction_drops_least_recently_used(self):
+        """Test a full cache evicts the least recently used entry."""
+        from synth_agent.llm.manager import LLMManager
+
+        provider = FakeProvider()
+        manager = LLMManager(provider, Config(), max_cache_size=2)
+
+        await manager.complete("a")
+        await manager.complete("b")
+        await manager.complete("a")  # refresh "a"
+        await manager.complete("c")  # evicts "b"
+        assert provider.calls == 3
+
+        await manager.complete("a")
+        assert provider.calls == 3
+        await manager.complete("b")
+        assert provider.calls == 4
+        assert manager.get_cache_stats()["size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self):
+        """Test identical in-flight requests are coalesced."""
+        from synth_agent.llm.manager import LLMManager
+
+        provider = FakeProvider()
+        release = asyncio.Event()
+        complete = provider.complete
+
+        async def slow_complete(prompt, **kwargs):
+            await release.wait()
+            return await complete(prompt, **kwargs)
+
+        provider.complete = slow_complete
+        manager = LLMManager(provider, Config())
+
+        tasks = [asyncio.create_task(manager.complete("same")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(*tasks)
+
+        assert provider.calls == 1
+        assert all(response is responses[0] for response in responses)
+        assert not manager._inflight
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        """Test a waiter takes over the call when the request making it is cancelled."""
+        from synth_agent.llm.manager import LLMManager
+
+        provider = FakeProvider()
+        release = asyncio.Event()
+        complete = provider.complete
+
+        async def slow_complete(prompt, **kwargs):
+            await release.wait()
+            return await complete(prompt, **kwargs)
+
+        provider.complete = slow_complete
+        manager = LLMManager(provider, Config())
+
+        leader = asyncio.create_task(manager.complete("same"))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(manager.complete("same")) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert [response.content for response in responses] == ["same", "same"]
+        assert provider.calls == 1
+        assert not manager._inflight
+
+    @pytest.mark.asyncio
+    async def test_complete_many_preserves_order_and_shares_cache(self):
+        """Test batched completions keep prompt order and reuse requests."""
+        from synth_agent.llm.manager import LLMManager
+
+        provider = FakeProvider()
+        manager = LLMManager(provider, Config())
+
+        responses = await manager.complete_many(["a", "b", "a"])
+
+        assert [response.content for response in responses] == ["a", "b", "a"]
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_sweeper_drops_expired_entries(self):
+        """Test expired entries are swept without being looked up."""
+        import gc
+        import weakref
+
+        from synth_agent.llm.manager import LLMManager
+
+        config = Config()
+        config.llm.cache_ttl = 0
+        manager = LLMManager(FakeProvider(), config)
+
+        await manager.complete("a")
+        assert manager._sweeper_task is not None
+        manager._evict_expired()
+        assert manager.get_cache_stats()["size"] == 0
+
+        # The running sweeper does not keep the manager alive
+        task = manager._sweeper_task
+        manager_ref = weakref.ref(manager)
+        del manager
+        gc.collect()
+        assert manager_ref() is None
+        task.cancel()
+
+
+class TestLLMManagerRetry:
+    """Component tests for LLMManager retry backoff."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("retry_after, low, high", [(None, 0.5, 1.5), (7.0, 7.0, 7.0)])
+    async def test_retry_delay_is_jittered_or_provider_directed(self, retry_after, low, high):
+        """Test backoff jitters the configured delay unless Retry-After is given."""
+        from synth_agent.llm.manager import LLMManager
+
+        config = Config()
+        config.llm.max_retries = 1
+        config.llm.retry_delays = [1]
+        manager = LLMManager(Mock(), config, enable_cache=False)
+
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise LLMProviderError("rate limited", retry_after=retry_after)
+            return "ok"
+
+        with patch("synth_agent.llm.manager.asyncio.sleep") as mock_sleep:
+            assert await manager._retry_with_backoff(flaky) == "ok"
+
+        delay = mock_sleep.call_args.args[0]
+        assert low <= delay <= high
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("retry_after, retry_delays", [(None, [600]), (3600.0, [1])])
+    async def test_retry_delay_is_clamped_to_max_retry_delay(self, retry_after, retry_delays):
+        """Test neither the configured delay nor Retry-After exceeds max_retry_delay."""
+        from synth_agent.llm.manager import LLMManager
+
+        config = Config()
+        config.llm.max_retries = 1
+        config.llm.retry_delays = retry_delays
+        config.llm.max_retry_delay = 10
+        manager = LLMManager(Mock(), config, enable_cache=False)
+
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise LLMProviderError("rate limited", retry_after=retry_after)
+            return "ok"
+
+        with patch("synth_agent.llm.manager.asyncio.sleep") as mock_sleep:
+            assert await manager._retry_with_backoff(flaky) == "ok"
+
+        assert mock_sleep.call_args.args[0] == 10
+
+
 class TestFormatManagerComponent:
     """Component tests for FormatManager."""
 
@@ -0,0 +1,53 @@
+"""Unit tests for Best-First Search reasoning."""
+
+import pytest
+
+from synth_agent.reasoning.best_first_search import BestFirstSearchReasoner, PrioritizedNode
+
+
+@pytest.fixture
+def reasoner():
+    """Create a Best-First Search reasoner."""
+    return BestFirstSearchReasoner()
+
+
+class TestSuccessorPriorities:
+    """Tests for priorities derived from the parent node."""
+
+    @pytest.mark.parametrize(
+        "requirements",
+        [
+            {},
+            {"fields": [{"name": "created_at", "type": "timestamp"}]},
+            {"constraints": ["Sequential IDs"], "quality_requirements": {}},
+            {"quality_requirements": {"temporal_consistency": True}},
+            {
+                "fields": [{"name": "event_date", "type": "datetime"}, "raw"],
+                "constraints": ["Maintain temporal ordering", 42],
+                "quality_requirements": {"temporal_consistency": False},
+            },
+        ],
+    )
+    def test_priorities_match_full_heuristic(self, reasoner, requirements):
+        """Test that delta priorities equal a full heuristic rescan."""
+        node = PrioritizedNode(
+            priority=-reasoner._heuristic(requirements),
+            requirements=requirements,
+        )
+
+        for _ in range(3):
+            successors = reasoner._generate_successors(node)
+            for successor in successors:
+                assert successor.priority == pytest.approx(
+                    -reasoner._heuristic(successor.requirements)
+                )
+            node = successors[-1]
+
+    def test_successors_do_not_modify_parent(self, reasoner):
+        """Test that generating successors leaves the parent untouched."""
+        requirements = {"constraints": ["a"], "quality_requirements": {"level": "high"}}
+        node = PrioritizedNode(priority=0.0, requirements=requirements)
+
+        reasoner._generate_successors(node)
+
+        assert requirements == {"constraints": ["a"], "quality_requirements": {"level": "high"}}
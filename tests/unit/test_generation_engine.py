@@ -0,0 +1,64 @@
+"""Unit tests for the data generation engine."""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from synth_agent.core.config import Config
+from synth_agent.generation.engine import DataGenerationEngine
+
+
+NATIVE_SCHEMA = {
+    "fields": [
+        {"name": "quantity", "type": "integer", "min": 1, "max": 10},
+        {"name": "ratio", "type": "float", "min": 0.0, "max": 1.0},
+        {"name": "active", "type": "boolean"},
+        {"name": "joined_on", "type": "date"},
+        {"name": "seen_at", "type": "datetime"},
+    ],
+    "quality_controls": {"null_percentage": 0.0},
+}
+
+
+class TestArrowGeneration:
+    """Tests for the Arrow generation path behind generate()."""
+
+    def test_native_schema_matches_dataframe_path(self):
+        """Test Arrow-generated columns have the DataFrame path's dtypes and value ranges."""
+        engine = DataGenerationEngine(Config(), seed=0)
+
+        with patch.object(engine, "generate_arrow", wraps=engine.generate_arrow) as arrow:
+            arrow_df = engine.generate(NATIVE_SCHEMA, 500)
+        arrow.assert_called_once()
+
+        with patch.object(DataGenerationEngine, "_uses_arrow_path", return_value=False):
+            pandas_df = engine.generate(NATIVE_SCHEMA, 500)
+
+        pd.testing.assert_series_equal(arrow_df.dtypes, pandas_df.dtypes)
+        for df in (arrow_df, pandas_df):
+            assert df["quantity"].between(1, 10).all()
+            assert df["ratio"].between(0.0, 1.0).all()
+            assert set(df["active"]) == {True, False}
+            assert (df["joined_on"] == df["joined_on"].dt.normalize()).all()
+        assert set(arrow_df["quantity"]) == set(pandas_df["quantity"])
+        assert abs(arrow_df["seen_at"].min() - pandas_df["seen_at"].min()) < pd.Timedelta(
+            days=30
+        )
+
+    @pytest.mark.parametrize("field", [
+        {"name": "birth_date", "type": "date"},
+        {"name": "count", "type": "integer", "constraints": [{"type": "unique"}]},
+        {"name": "location", "type": "point"},
+        {"name": "duration", "type": "interval"},
+    ])
+    def test_fields_the_arrow_path_cannot_match_use_dataframe_path(self, field):
+        """Test semantic, constrained and non-native fields keep per-field generation."""
+        engine = DataGenerationEngine(Config(), seed=0)
+        schema = {"fields": [field], "quality_controls": {"null_percentage": 0.0}}
+
+        with patch.object(engine, "generate_arrow") as arrow:
+            df = engine.generate(schema, 20)
+
+        arrow.assert_not_called()
+        assert len(df) == 20
@@ -0,0 +1,66 @@
+"""Unit tests for Graph of Thoughts reasoning."""
+
+import pytest
+
+from synth_agent.reasoning.graph_of_thoughts import GraphNode, GraphOfThoughtsReasoner
+
+
+@pytest.fixture
+def reasoner():
+    """Create a Graph of Thoughts reasoner."""
+    return GraphOfThoughtsReasoner()
+
+
+def make_graph(edges, isolated=()):
+    """Build a graph from undirected edges plus isolated node ids."""
+    graph = {}
+    for node_id in isolated:
+        graph[node_id] = GraphNode(id=node_id, requirements={})
+    for a, b in edges:
+        graph.setdefault(a, GraphNode(id=a, requirements={})).connections.add(b)
+        graph.setdefault(b, GraphNode(id=b, requirements={})).connections.add(a)
+    return graph
+
+
+class TestBuildThoughtGraph:
+    """Tests for thought graph construction."""
+
+    def test_fields_sharing_a_word_are_connected(self, reasoner):
+        """Test that fields are connected when their names share a word."""
+        graph = reasoner._build_thought_graph({
+            "fields": [
+                {"name": "user_id"},
+                {"name": "user_name"},
+                {"name": "order_id"},
+                {"name": "total"},
+            ],
+        })
+
+        assert graph["field_user_id"].connections == {"field_user_name", "field_order_id"}
+        assert graph["field_user_name"].connections == {"field_user_id"}
+        assert graph["field_order_id"].connections == {"field_user_id"}
+        assert graph["field_total"].connections == set()
+
+
+class TestAnalyzeGraph:
+    """Tests for graph structure analysis."""
+
+    def test_empty_graph(self, reasoner):
+        """Test analysis of an empty graph."""
+        assert reasoner._analyze_graph({})["connected_components"] == 0
+
+    def test_counts_each_connected_component(self, reasoner):
+        """Test that separate connected groups are counted separately."""
+        graph = make_graph([("a", "b"), ("b", "c"), ("d", "e")], isolated=["f"])
+
+        analysis = reasoner._analyze_graph(graph)
+
+        assert analysis["connected_components"] == 3
+        assert analysis["avg_connections"] == 1.0
+        assert analysis["density"] == pytest.approx(3 / 15)
+
+    def test_single_component(self, reasoner):
+        """Test that a fully connected graph is one component."""
+        graph = make_graph([("a", "b"), ("c", "d"), ("b", "c"), ("d", "a")])
+
+        assert reasoner._analyze_graph(graph)["connected_components"] == 1
@@ -0,0 +1,74 @@
+"""Unit tests for MCTS reasoning."""
+
+import copy
+
+import pytest
+
+from synth_agent.reasoning.mcts_reasoner import MCTSReasoner
+
+
+@pytest.fixture
+def reasoner():
+    """Create an MCTS reasoner."""
+    return MCTSReasoner()
+
+
+@pytest.fixture
+def requirements():
+    """Requirements with numeric and non-numeric fields."""
+    return {
+        "fields": [
+            {"name": "amount", "type": "float"},
+            {"name": "account_id", "type": "string"},
+        ],
+        "constraints": ["Amounts must balance"],
+        "quality_requirements": {"null_percentage": 0.0},
+    }
+
+
+class TestCreateVariation:
+    """Tests for requirement variations."""
+
+    def test_does_not_modify_input(self, reasoner, requirements):
+        """Test that variations copy what they change."""
+        original = copy.deepcopy(requirements)
+
+        variation = reasoner._create_variation(requirements)
+
+        assert requirements == original
+        assert variation["quality_requirements"]["referential_integrity"] is True
+        assert "distribution" in variation["fields"][0]
+        assert "distribution" not in variation["fields"][1]
+
+    def test_returns_input_when_nothing_to_add(self, reasoner, requirements):
+        """Test that a complete variation is returned unchanged."""
+        variation = reasoner._create_variation(requirements)
+
+        assert reasoner._create_variation(variation) is variation
+
+
+class TestReason:
+    """Tests for the MCTS search."""
+
+    @pytest.mark.asyncio
+    async def test_does_not_modify_input(self, reasoner, requirements):
+        """Test that reasoning leaves the caller's requirements untouched."""
+        original = copy.deepcopy(requirements)
+
+        result = await reasoner.reason(requirements)
+
+        assert requirements == original
+        assert result.enhanced_requirements["quality_requirements"]["referential_integrity"]
+
+    @pytest.mark.asyncio
+    async def test_result_does_not_share_objects_with_input(self, reasoner, requirements):
+        """Test that changing the result leaves the caller's requirements untouched."""
+        original = copy.deepcopy(requirements)
+
+        result = await reasoner.reason(requirements)
+        enhanced = result.enhanced_requirements
+        enhanced["constraints"].append("Added later")
+        for field in enhanced["fields"]:
+            field["type"] = "changed"
+
+        assert requirements == original
@@ -84,6 +84,19 @@ class TestParquetFormatter:
         assert len(df_read) == len(sample_dataframe)
         assert list(df_read.columns) == list(sample_dataframe.columns)
 
+    def test_parquet_export_arrow(self, sample_dataframe, tmp_path):
+        """Test Parquet export from an Arrow table."""
+        import pyarrow as pa
+
+        formatter = ParquetFormatter({"compression": "snappy"})
+        table = pa.Table.from_pandas(sample_dataframe, preserve_index=False)
+
+        output_path = tmp_path / "test.parquet"
+        formatter.export_arrow(table, output_path)
+
+        df_read = pd.read_parquet(output_path)
+        pd.testing.assert_frame_equal(df_read, sample_dataframe, check_dtype=False)
+
     def test_parquet_get_extension(self):
         """Test get_extension method."""
         formatter = ParquetFormatter({})
@@ -176,6 +189,23 @@ class TestSQLFormatter:
             # MySQL uses multi-row inserts
             assert "VALUES" in content
 
+    def test_sql_escapes_quotes_and_nulls(self, tmp_path):
+        """Test quote escaping and NULL handling."""
+        df = pd.DataFrame({
+            "id": [1, 2],
+            "name": ["O'Brien", None],
+            "score": [1.5, None],
+            "active": [True, False]
+        })
+        formatter = SQLFormatter({"table_name": "users", "include_create": False})
+
+        output_path = tmp_path / "test.sql"
+        formatter.export(df, output_path)
+
+        content = output_path.read_text()
+        assert "VALUES (1, 'O''Brien', 1.5, TRUE);" in content
+        assert "VALUES (2, NULL, NULL, FALSE);" in content
+
 
 class TestAVROFormatter:
     """Test AVRO format handler."""
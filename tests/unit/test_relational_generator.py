@@ -100,12 +100,39 @@ class TestRelationalDataGenerator:
             }
         ]
 
-        # Get generation order
-        order = generator._get_generation_order(table_schemas, relationships)
+        # Get generation levels
+        levels = generator._get_generation_levels(table_schemas, relationships)
 
         # Verify countries -> cities -> stores
-        assert order.index("countries") < order.index("cities")
-        assert order.index("cities") < order.index("stores")
+        assert levels == [["countries"], ["cities"], ["stores"]]
+
+    def test_generation_levels_group_independent_tables(self):
+        """Test sibling tables share a level after their common parent."""
+        generator = RelationalDataGenerator()
+
+        table_schemas = {
+            "customers": {"fields": [{"name": "id", "type": "integer"}]},
+            "orders": {"fields": [{"name": "customer_id", "type": "integer"}]},
+            "reviews": {"fields": [{"name": "customer_id", "type": "integer"}]},
+        }
+        relationships = [
+            {
+                "from_table": "orders",
+                "from_column": "customer_id",
+                "to_table": "customers",
+                "to_column": "id",
+            },
+            {
+                "from_table": "reviews",
+                "from_column": "customer_id",
+                "to_table": "customers",
+                "to_column": "id",
+            },
+        ]
+
+        levels = generator._get_generation_levels(table_schemas, relationships)
+
+        assert levels == [["customers"], ["orders", "reviews"]]
 
     def test_circular_dependency_detection(self):
         """Test detection of circular dependencies."""
@@ -135,7 +162,7 @@ class TestRelationalDataGenerator:
         ]
 
         with pytest.raises(DataGenerationError, match="Circular dependency"):
-            generator._get_generation_order(table_schemas, relationships)
+            generator._get_generation_levels(table_schemas, relationships)
 
     def test_one_to_one_relationship(self):
         """Test one-to-one relationship."""
@@ -171,6 +198,39 @@ class TestRelationalDataGenerator:
         # Verify one-to-one (all user_ids should be unique)
         assert len(tables["profiles"]["user_id"].unique()) == len(tables["profiles"])
 
+    def test_one_to_one_keys_are_not_ordered_like_parents(self):
+        """Test one-to-one foreign keys are a random permutation of the parent keys."""
+        generator = RelationalDataGenerator(seed=0)
+
+        table_schemas = {
+            "users": {
+                "fields": [{"name": "id", "type": "integer"}]
+            },
+            "profiles": {
+                "fields": [{"name": "user_id", "type": "integer"}]
+            }
+        }
+
+        relationships = [
+            {
+                "from_table": "profiles",
+                "from_column": "user_id",
+                "to_table": "users",
+                "to_column": "id",
+                "relationship_type": "one_to_one"
+            }
+        ]
+
+        row_counts = {"users": 20, "profiles": 20}
+        tables = generator.generate_relational_dataset(
+            table_schemas, relationships, row_counts
+        )
+
+        user_ids = tables["users"]["id"].tolist()
+        profile_user_ids = tables["profiles"]["user_id"].tolist()
+        assert sorted(profile_user_ids) == sorted(user_ids)
+        assert profile_user_ids != user_ids
+
     def test_junction_table_creation(self):
         """Test many-to-many junction table creation."""
         generator = RelationalDataGenerator()
@@ -211,6 +271,26 @@ class TestRelationalDataGenerator:
         assert set(junction["students_id"]).issubset(student_ids)
         assert set(junction["courses_id"]).issubset(course_ids)
 
+    def test_junction_table_keeps_null_parent_keys(self):
+        """Test a null parent key is referenced as null, not as another parent."""
+        generator = RelationalDataGenerator(seed=0)
+        generator.tables["students"] = pd.DataFrame({"id": [1.0, np.nan, 3.0]})
+        generator.tables["courses"] = pd.DataFrame({"id": [10, 20]})
+
+        junction = generator.add_junction_table(
+            table_name="enrollments",
+            left_table="students",
+            left_column="id",
+            right_table="courses",
+            right_column="id",
+            num_relationships=200
+        )
+
+        student_ids = junction["students_id"]
+        assert student_ids.isna().sum() == 2  # one row per course
+        assert set(student_ids.dropna()) == {1.0, 3.0}
+        assert not junction.duplicated().any()
+
     def test_missing_relationship_fields(self):
         """Test validation of relationship definitions."""
         generator = RelationalDataGenerator()
@@ -246,3 +326,35 @@ class TestRelationalDataGenerator:
 
         with pytest.raises(DataGenerationError, match="not found"):
             generator._validate_relationships(table_schemas, relationships)
+
+    def test_seed_makes_generation_reproducible(self):
+        """Test the same seed yields identical tables."""
+        table_schemas = {
+            "customers": {"fields": [{"name": "id", "type": "integer"}]},
+            "orders": {
+                "fields": [
+                    {"name": "customer_id", "type": "integer"},
+                    {"name": "amount", "type": "float"}
+                ]
+            }
+        }
+        relationships = [
+            {
+                "from_table": "orders",
+                "from_column": "customer_id",
+                "to_table": "customers",
+                "to_column": "id",
+                "relationship_type": "many_to_one"
+            }
+        ]
+        row_counts = {"customers": 10, "orders": 50}
+
+        first = RelationalDataGenerator(seed=42).generate_relational_dataset(
+            table_schemas, relationships, row_counts
+        )
+        second = RelationalDataGenerator(seed=42).generate_relational_dataset(
+            table_schemas, relationships, row_counts
+        )
+
+        for name in table_schemas:
+            pd.testing.assert_frame_equal(first[name], second[name])